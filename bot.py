@@ -14,21 +14,30 @@ import io
 import sqlite3
 import asyncio
 import logging
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone, date, time as _time
 from zoneinfo import ZoneInfo
 from typing import Optional, List, Dict, Set, Tuple
 
 import discord
 from discord.ext import commands
+from discord.utils import format_dt
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from apscheduler.triggers.date import DateTrigger
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger("bot")
 
-intents = discord.Intents.default()
+# Nur die Gateway-Events abonnieren, die der Bot wirklich nutzt: Kanäle/Mitglieder für Namen,
+# Nachrichten samt Inhalt für die !-Befehle. Buttons und Modals kommen ohne Intent an.
+intents = discord.Intents.none()
+intents.guilds = True
 intents.members = True
+intents.guild_messages = True
+intents.dm_messages = True
 intents.message_content = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 
@@ -38,125 +47,414 @@ CHANNEL_ID = int(os.getenv("CHANNEL_ID", "0")) if os.getenv("CHANNEL_ID") else N
 CREATED_EVENTS_CHANNEL_ID = int(os.getenv("CREATED_EVENTS_CHANNEL_ID", "0")) if os.getenv("CREATED_EVENTS_CHANNEL_ID") else None
 QUARTERLY_CHANNEL_ID = int(os.getenv("QUARTERLY_CHANNEL_ID", "0")) if os.getenv("QUARTERLY_CHANNEL_ID") else None
 POST_TIMEZONE = os.getenv("POST_TIMEZONE", "Europe/Berlin")
+_TZ = ZoneInfo(POST_TIMEZONE)
+_ID_TIME_FMT = "%Y%m%dT%H%M%S"
+_SUMMARY_TIME_FMT = "%d.%m. %H:%M"
+
+# Embed-Farben einmal anlegen statt pro Render
+_COLOR_BLURPLE = discord.Color.blurple()
+_COLOR_BLUE = discord.Color.blue()
+_COLOR_GREEN = discord.Color.green()
+
+def format_event_when(start_dt: datetime, end_dt: Optional[datetime]) -> str:
+    """Zeitraum als Discord-Timestamps; der Client zeigt ihn in der Zeitzone und Sprache des Lesers an."""
+    if end_dt is None:
+        return format_dt(start_dt, style="F")
+    if start_dt.date() == end_dt.date():
+        return f"{format_dt(start_dt, style='F')} – {format_dt(end_dt, style='t')}"
+    return f"{format_dt(start_dt, style='f')} – {format_dt(end_dt, style='f')}"
+
+_db_con: Optional[sqlite3.Connection] = None
+_db_lock = threading.RLock()
+
+# Einstellungen der Verbindung, als ein Skript statt einzelner execute-Aufrufe
+DB_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    -- ~64 MB Page-Cache und Memory-Mapping bis 256 MB; die Verbindung lebt so lange wie der Prozess
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+    -- WAL-Datei nach Checkpoints auf 64 MB kürzen, statt sie auf Spitzengröße stehen zu lassen
+    PRAGMA journal_size_limit=67108864;
+"""
 
-weekday_names = {
-    'Monday': 'Montag',
-    'Tuesday': 'Dienstag',
-    'Wednesday': 'Mittwoch',
-    'Thursday': 'Donnerstag',
-    'Friday': 'Freitag',
-    'Saturday': 'Samstag',
-    'Sunday': 'Sonntag'
-}
+def get_db_connection() -> sqlite3.Connection:
+    """Eine langlebige Verbindung (Autocommit, WAL) für den ganzen Prozess.
+
+    Bewusst ohne cache=shared: es gibt nur diese eine Verbindung, ihr Page-Cache ist schon der gemeinsame.
+    Shared-Cache würde mit WAL nur Tabellen-Locks statt paralleler Leser bringen.
+    """
+    global _db_con
+    with _db_lock:
+        if _db_con is None:
+            # timeout=5.0 ist sqlite3s busy_timeout: fremde Leser/Backups lösen kein sofortiges SQLITE_BUSY aus.
+            # Der Statement-Cache lebt mit der Verbindung; 256 Plätze reichen für alle festen SQL-Texte des Bots,
+            # sodass jedes Statement nur einmal kompiliert wird
+            con = sqlite3.connect(DB_PATH, timeout=5.0, check_same_thread=False, isolation_level=None,
+                                  cached_statements=256)
+            con.executescript(DB_PRAGMAS)
+            _db_con = con
+        return _db_con
+
+def close_db():
+    """Beim Beenden einmal schließen: PRAGMA optimize frischt die Planer-Statistiken auf,
+    und das Schließen der letzten Verbindung checkpointet die WAL-Datei und räumt sie weg."""
+    global _db_con
+    with _db_lock:
+        if _db_con is None:
+            return
+        try:
+            _db_con.execute("PRAGMA optimize")
+        finally:
+            _db_con.close()
+            _db_con = None
+
+def ensure_column(cur: sqlite3.Cursor, table: str, column: str, decl: str) -> bool:
+    """Fügt eine Spalte hinzu, falls sie fehlt. True, wenn sie neu angelegt wurde."""
+    existing = {row[1] for row in cur.execute(f"PRAGMA table_info({table})")}
+    if column in existing:
+        return False
+    cur.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+    return True
+
+def ensure_without_rowid(cur: sqlite3.Cursor, table: str, create_sql: str, columns: str) -> bool:
+    """Legt die Tabelle als WITHOUT ROWID an bzw. baut eine alte Rowid-Tabelle um. True, wenn migriert wurde."""
+    row = cur.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    if row is None:
+        cur.execute(create_sql.format(table=table))
+        return False
+    if "WITHOUT ROWID" in row[0].upper():
+        return False
+    cur.execute("BEGIN IMMEDIATE")
+    try:
+        cur.execute(create_sql.format(table=f"{table}_new"))
+        cur.execute(f"INSERT OR IGNORE INTO {table}_new({columns}) SELECT {columns} FROM {table}")
+        cur.execute(f"DROP TABLE {table}")
+        cur.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+    except Exception:
+        cur.execute("ROLLBACK")
+        raise
+    cur.execute("COMMIT")
+    return True
+
+# Tabellen ohne Migrationen: ein Skript, eine Transaktion. Neue Tabellen/Indizes nur hier ergänzen.
+SCHEMA_TABLES = """
+    BEGIN;
+    CREATE TABLE IF NOT EXISTS polls (
+        id TEXT PRIMARY KEY,
+        created_at TEXT NOT NULL,
+        created_at_epoch INTEGER
+    );
+    CREATE TABLE IF NOT EXISTS options (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        poll_id TEXT NOT NULL,
+        option_text TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        author_id INTEGER,
+        created_at_epoch INTEGER
+    );
+    CREATE TABLE IF NOT EXISTS daily_summaries (
+        channel_id INTEGER PRIMARY KEY,
+        message_id INTEGER,
+        created_at INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS weekly_summaries (
+        channel_id INTEGER PRIMARY KEY,
+        message_id INTEGER,
+        created_at INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS created_events (
+        id TEXT PRIMARY KEY,
+        poll_id TEXT,
+        title TEXT,
+        description TEXT,
+        start_time TEXT,
+        end_time TEXT,
+        participants TEXT,
+        location TEXT,
+        posted_channel_id INTEGER,
+        posted_message_id INTEGER,
+        created_at TEXT NOT NULL,
+        next_reminder_at INTEGER,
+        next_reminder_hours INTEGER,
+        reminder_channel_id INTEGER,
+        start_epoch INTEGER
+    );
+    CREATE TABLE IF NOT EXISTS created_event_rsvps (
+        event_id TEXT NOT NULL,
+        user_id INTEGER NOT NULL,
+        UNIQUE(event_id, user_id)
+    );
+    CREATE TABLE IF NOT EXISTS poll_messages (
+        poll_id TEXT PRIMARY KEY,
+        channel_id INTEGER NOT NULL,
+        message_id INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS last_posted_matches (
+        poll_id TEXT PRIMARY KEY,
+        matches TEXT NOT NULL,
+        updated_at INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS last_posted_weekly_matches (
+        poll_id TEXT PRIMARY KEY,
+        matches TEXT NOT NULL,
+        updated_at INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS settings (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    COMMIT;
+"""
+
+# Indizes erst nach den Spalten-Migrationen anlegen, sie verweisen auf nachgerüstete Spalten
+SCHEMA_INDEXES = """
+    BEGIN;
+    -- Neueste Umfrage(n) für Summaries und Start: Index-Scan rückwärts statt Sortieren der ganzen Tabelle
+    DROP INDEX IF EXISTS idx_polls_created;
+    CREATE INDEX IF NOT EXISTS idx_polls_epoch ON polls(created_at_epoch);
+    -- Optionen werden immer pro Umfrage gelesen, für die Summaries zusätzlich nach created_at_epoch gefiltert.
+    -- idx_options_poll liefert (poll_id, id) – get_options kommt damit ohne Sortierschritt aus.
+    DROP INDEX IF EXISTS idx_options_poll_created;
+    CREATE INDEX IF NOT EXISTS idx_options_poll_epoch ON options(poll_id, created_at_epoch);
+    CREATE INDEX IF NOT EXISTS idx_options_poll ON options(poll_id);
+    CREATE INDEX IF NOT EXISTS idx_created_events_next_reminder ON created_events(next_reminder_at);
+    -- Stimmen und Zeiten brauchen keinen Zusatzindex: ihre Primärschlüssel beginnen mit poll_id.
+    -- RSVPs werden in Klick-Reihenfolge (rowid) gelesen; (event_id) liefert sie so ohne Sortierschritt,
+    -- der UNIQUE-Index (event_id, user_id) nur nach user_id sortiert
+    CREATE INDEX IF NOT EXISTS idx_rsvps_event ON created_event_rsvps(event_id);
+    COMMIT;
+"""
 
 def init_db():
-    con = sqlite3.connect(DB_PATH)
+    con = get_db_connection()
     cur = con.cursor()
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS polls (
-            id TEXT PRIMARY KEY,
-            created_at TEXT NOT NULL
-        )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS options (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            poll_id TEXT NOT NULL,
-            option_text TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            author_id INTEGER
-        )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS votes (
+    cur.executescript(SCHEMA_TABLES)
+    # Zeitfilter und Sortierung vergleichen Ganzzahlen statt ISO-Strings; created_at bleibt für die Anzeige
+    if ensure_column(cur, "polls", "created_at_epoch", "INTEGER"):
+        cur.execute("UPDATE polls SET created_at_epoch = CAST(strftime('%s', created_at) AS INTEGER)")
+    if ensure_column(cur, "options", "created_at_epoch", "INTEGER"):
+        cur.execute("UPDATE options SET created_at_epoch = CAST(strftime('%s', created_at) AS INTEGER)")
+    # Stimmen und Zeiten bestehen nur aus ihrem Schlüssel: WITHOUT ROWID spart den zweiten B-Baum
+    # des UNIQUE-Index, jeder Insert schreibt nur noch eine Struktur
+    ensure_without_rowid(cur, "votes", """
+        CREATE TABLE {table} (
             poll_id TEXT NOT NULL,
             option_id INTEGER NOT NULL,
             user_id INTEGER NOT NULL,
-            UNIQUE(poll_id, option_id, user_id)
-        )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS availability (
+            PRIMARY KEY (poll_id, option_id, user_id)
+        ) WITHOUT ROWID
+    """, "poll_id, option_id, user_id")
+    ensure_without_rowid(cur, "availability", """
+        CREATE TABLE {table} (
             poll_id TEXT NOT NULL,
             user_id INTEGER NOT NULL,
             slot TEXT NOT NULL,
-            UNIQUE(poll_id, user_id, slot)
-        )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS daily_summaries (
-            channel_id INTEGER PRIMARY KEY,
-            message_id INTEGER,
-            created_at TEXT NOT NULL
-        )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS weekly_summaries (
-            channel_id INTEGER PRIMARY KEY,
-            message_id INTEGER,
-            created_at TEXT NOT NULL
-        )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS created_events (
-            id TEXT PRIMARY KEY,
-            poll_id TEXT,
-            title TEXT,
-            description TEXT,
-            start_time TEXT,
-            end_time TEXT,
-            participants TEXT,
-            location TEXT,
-            posted_channel_id INTEGER,
-            posted_message_id INTEGER,
-            created_at TEXT NOT NULL
-        )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS created_event_rsvps (
-            event_id TEXT NOT NULL,
-            user_id INTEGER NOT NULL,
-            UNIQUE(event_id, user_id)
-        )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS last_posted_matches (
-            poll_id TEXT PRIMARY KEY,
-            matches TEXT NOT NULL,
-            updated_at TEXT NOT NULL
-        )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS last_posted_weekly_matches (
-            poll_id TEXT PRIMARY KEY,
-            matches TEXT NOT NULL,
-            updated_at TEXT NOT NULL
-        )
-    """)
-    con.commit()
-    con.close()
+            PRIMARY KEY (poll_id, user_id, slot)
+        ) WITHOUT ROWID
+    """, "poll_id, user_id, slot")
+    if ensure_column(cur, "created_events", "start_epoch", "INTEGER"):
+        cur.execute("UPDATE created_events SET start_epoch = CAST(strftime('%s', start_time) AS INTEGER) WHERE start_time IS NOT NULL")
+    if ensure_column(cur, "created_events", "next_reminder_at", "INTEGER"):
+        ensure_column(cur, "created_events", "next_reminder_hours", "INTEGER")
+        ensure_column(cur, "created_events", "reminder_channel_id", "INTEGER")
+        # Bestehende zukünftige Events an den Erinnerungs-Dispatcher übergeben
+        cur.execute("""
+            UPDATE created_events
+            SET next_reminder_at = CAST(strftime('%s', start_time) AS INTEGER) - 86400,
+                next_reminder_hours = 24,
+                reminder_channel_id = posted_channel_id
+            WHERE posted_channel_id IS NOT NULL
+              AND CAST(strftime('%s', start_time) AS INTEGER) > CAST(strftime('%s', 'now') AS INTEGER)
+        """)
+    cur.executescript(SCHEMA_INDEXES)
 
 def safe_db_query(query: str, params=(), fetch=False, many=False):
-    con = sqlite3.connect(DB_PATH)
-    cur = con.cursor()
-    try:
+    con = get_db_connection()
+    with _db_lock:
         if many:
-            cur.executemany(query, params)
-        else:
-            cur.execute(query, params)
-        rows = cur.fetchall() if fetch else None
-        con.commit()
-        return rows
+            # executemany als eine Transaktion statt einem Commit pro Zeile
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                con.executemany(query, params)
+            except Exception:
+                con.execute("ROLLBACK")
+                raise
+            con.execute("COMMIT")
+            return None
+        cur = con.execute(query, params)
+        return cur.fetchall() if fetch else None
+
+def safe_db_transaction(statements: List[Tuple[str, tuple]]):
+    """Mehrere (query, params) atomar in einer Transaktion – ein Commit statt einem pro Statement."""
+    con = get_db_connection()
+    with _db_lock:
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            for query, params in statements:
+                con.execute(query, params)
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
+
+# Feste SQL-Texte für den Event-/Erinnerungspfad: gleicher String → sqlite3 verwendet das
+# vorbereitete Statement der geteilten Verbindung wieder.
+SQL_SELECT_CREATED_EVENT_BUNDLE = """
+    SELECT e.title, e.description, e.start_time, e.end_time, e.participants, e.location,
+           e.posted_channel_id, e.posted_message_id, e.start_epoch,
+           (SELECT GROUP_CONCAT(user_id) FROM (
+                SELECT user_id FROM created_event_rsvps WHERE event_id = e.id ORDER BY rowid))
+    FROM created_events e WHERE e.id = ?
+"""
+SQL_SELECT_CREATED_EVENTS = ("SELECT id, title, description, start_time, end_time, participants, location, "
+                             "posted_channel_id, posted_message_id, start_epoch FROM created_events")
+SQL_SELECT_RSVP_CSV = ("SELECT GROUP_CONCAT(user_id) FROM ("
+                       "SELECT user_id FROM created_event_rsvps WHERE event_id = ? ORDER BY rowid)")
+SQL_INSERT_CREATED_EVENT = ("INSERT INTO created_events(id, poll_id, title, description, start_time, end_time, participants, "
+                            "location, posted_channel_id, posted_message_id, created_at, start_epoch) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+# Beim Start werden nur die Views der letzten Umfragen neu registriert
+SQL_SELECT_RECENT_POLL_IDS = "SELECT id FROM polls ORDER BY created_at_epoch DESC LIMIT 20"
+SQL_SELECT_RECENT_POLL_OPTIONS = ("SELECT poll_id, id, option_text, created_at, author_id FROM options "
+                                  f"WHERE poll_id IN ({SQL_SELECT_RECENT_POLL_IDS}) ORDER BY id ASC")
+SQL_SELECT_RECENT_POLL_MESSAGES = ("SELECT poll_id, channel_id, message_id FROM poll_messages "
+                                   f"WHERE poll_id IN ({SQL_SELECT_RECENT_POLL_IDS})")
+SQL_INSERT_RSVP = "INSERT OR IGNORE INTO created_event_rsvps(event_id, user_id) VALUES (?, ?)"
+SQL_DELETE_RSVP = "DELETE FROM created_event_rsvps WHERE event_id = ? AND user_id = ?"
+SQL_SET_EVENT_POSTED = "UPDATE created_events SET posted_channel_id = ?, posted_message_id = ? WHERE id = ?"
+SQL_CLEAR_EVENT_POSTED = "UPDATE created_events SET posted_channel_id = NULL, posted_message_id = NULL WHERE id = ?"
+SQL_SET_FIRST_REMINDER = "UPDATE created_events SET next_reminder_at = ?, next_reminder_hours = ?, reminder_channel_id = ? WHERE id = ?"
+SQL_ADVANCE_REMINDER = "UPDATE created_events SET next_reminder_at = ?, next_reminder_hours = ? WHERE id = ?"
+# Die frühesten Erinnerungen: fällige werden ausgelöst, die erste nicht fällige bestimmt die Schlafdauer
+SQL_SELECT_UPCOMING_REMINDERS = ("SELECT id, next_reminder_at, next_reminder_hours, reminder_channel_id, start_epoch FROM created_events "
+                                 "WHERE next_reminder_at IS NOT NULL ORDER BY next_reminder_at LIMIT ?")
+
+# Umfragen, Ideen, Stimmen und Verfügbarkeiten
+SQL_INSERT_POLL = "INSERT INTO polls(id, created_at, created_at_epoch) VALUES (?, ?, ?) ON CONFLICT(id) DO NOTHING"
+SQL_INSERT_OPTION = ("INSERT INTO options(poll_id, option_text, created_at, author_id, created_at_epoch) "
+                     "VALUES (?, ?, ?, ?, ?)")
+SQL_SELECT_OPTIONS = "SELECT id, option_text, created_at, author_id FROM options WHERE poll_id = ? ORDER BY id ASC"
+SQL_SELECT_USER_OPTIONS = "SELECT id, option_text, created_at FROM options WHERE poll_id = ? AND author_id = ? ORDER BY id ASC"
+SQL_SELECT_OPTIONS_SINCE = ("SELECT option_text, created_at_epoch FROM options WHERE poll_id = ? AND created_at_epoch >= ? "
+                            "ORDER BY created_at_epoch ASC, id ASC")
+SQL_DELETE_OPTION = "DELETE FROM options WHERE id = ?"
+SQL_DELETE_OPTION_VOTES = "DELETE FROM votes WHERE poll_id = ? AND option_id = ?"
+SQL_INSERT_VOTE = "INSERT OR IGNORE INTO votes(poll_id, option_id, user_id) VALUES (?, ?, ?)"
+SQL_DELETE_VOTE = "DELETE FROM votes WHERE poll_id = ? AND option_id = ? AND user_id = ?"
+SQL_SELECT_POLL_VOTES = "SELECT option_id, user_id FROM votes WHERE poll_id = ?"
+SQL_SELECT_OPTION_VOTERS = "SELECT user_id FROM votes WHERE poll_id = ? AND option_id = ?"
+SQL_INSERT_AVAILABILITY = "INSERT OR IGNORE INTO availability(poll_id, user_id, slot) VALUES (?, ?, ?)"
+SQL_DELETE_USER_AVAILABILITY = "DELETE FROM availability WHERE poll_id = ? AND user_id = ?"
+SQL_SELECT_USER_SLOTS = "SELECT slot FROM availability WHERE poll_id = ? AND user_id = ?"
+SQL_SELECT_POLL_AVAILABILITY = "SELECT user_id, slot FROM availability WHERE poll_id = ?"
+# Pro Abstimmendem ein Lookup über den Präfix (poll_id, user_id) des availability-Schlüssels
+SQL_SELECT_VOTERS_WITHOUT_AVAILABILITY = ("SELECT DISTINCT v.user_id FROM votes v WHERE v.poll_id = ? AND NOT EXISTS ("
+                                          "SELECT 1 FROM availability a WHERE a.poll_id = v.poll_id AND a.user_id = v.user_id)")
+
+# Summaries und Buchhaltung (letzte Posts, Nachrichten der Umfragen)
+SQL_SELECT_LAST_POSTED_MATCHES = "SELECT matches FROM last_posted_matches WHERE poll_id = ?"
+SQL_UPSERT_LAST_POSTED_MATCHES = ("INSERT INTO last_posted_matches(poll_id, matches, updated_at) VALUES (?, ?, ?) "
+                                  "ON CONFLICT(poll_id) DO UPDATE SET matches = excluded.matches, updated_at = excluded.updated_at")
+SQL_SELECT_LAST_POSTED_WEEKLY_MATCHES = "SELECT matches FROM last_posted_weekly_matches WHERE poll_id = ?"
+SQL_UPSERT_LAST_POSTED_WEEKLY_MATCHES = ("INSERT INTO last_posted_weekly_matches(poll_id, matches, updated_at) VALUES (?, ?, ?) "
+                                         "ON CONFLICT(poll_id) DO UPDATE SET matches = excluded.matches, updated_at = excluded.updated_at")
+SQL_UPSERT_POLL_MESSAGE = ("INSERT INTO poll_messages(poll_id, channel_id, message_id) VALUES (?, ?, ?) "
+                           "ON CONFLICT(poll_id) DO UPDATE SET channel_id = excluded.channel_id, message_id = excluded.message_id")
+SQL_DELETE_POLL_MESSAGE = "DELETE FROM poll_messages WHERE poll_id = ?"
+SQL_SELECT_DAILY_SUMMARY = "SELECT message_id FROM daily_summaries WHERE channel_id = ?"
+SQL_UPSERT_DAILY_SUMMARY = ("INSERT INTO daily_summaries(channel_id, message_id, created_at) VALUES (?, ?, ?) "
+                            "ON CONFLICT(channel_id) DO UPDATE SET message_id = excluded.message_id, created_at = excluded.created_at")
+SQL_SELECT_WEEKLY_SUMMARY = "SELECT message_id FROM weekly_summaries WHERE channel_id = ?"
+SQL_UPSERT_WEEKLY_SUMMARY = ("INSERT INTO weekly_summaries(channel_id, message_id, created_at) VALUES (?, ?, ?) "
+                             "ON CONFLICT(channel_id) DO UPDATE SET message_id = excluded.message_id, created_at = excluded.created_at")
+SQL_SELECT_SETTING = "SELECT value FROM settings WHERE key = ?"
+SQL_UPSERT_SETTING = ("INSERT INTO settings(key, value) VALUES (?, ?) "
+                      "ON CONFLICT(key) DO UPDATE SET value = excluded.value")
+SQL_SELECT_POLLS = "SELECT id, created_at FROM polls ORDER BY created_at_epoch DESC LIMIT ?"
+SQL_SELECT_LATEST_WEEKLY_POLL = ("SELECT id, created_at FROM polls WHERE id NOT LIKE '%_quarterly' "
+                                 "ORDER BY created_at_epoch DESC LIMIT 1")
+SQL_SELECT_LATEST_QUARTERLY_POLL = ("SELECT id, created_at FROM polls WHERE id LIKE '%_quarterly' "
+                                    "ORDER BY created_at_epoch DESC LIMIT 1")
+
+async def db_query_async(query: str, params=(), fetch=False, many=False):
+    """Wie safe_db_query, läuft aber im Thread-Pool statt auf dem Event-Loop."""
+    return await asyncio.to_thread(safe_db_query, query, params, fetch, many)
+
+# Klick-Schreibzugriffe (Stimmen, RSVPs) laufen über einen Writer-Task: was während eines Commits
+# auflädt, wird gesammelt und in der nächsten Transaktion geschrieben.
+WRITE_BATCH = 16
+_write_queue: Optional[asyncio.Queue] = None
+
+async def db_write(fn, *args):
+    """fn(*args) in der nächsten Schreib-Transaktion ausführen; ohne laufenden Writer direkt im Thread-Pool.
+
+    fn läuft innerhalb einer offenen Transaktion und darf deshalb kein eigenes BEGIN absetzen.
+    """
+    if _write_queue is None:
+        # auch ohne Writer in einer eigenen Transaktion, damit mehrteilige Schreibzugriffe atomar bleiben
+        [(ok, value)] = await asyncio.to_thread(_run_write_batch, [(fn, args, None)])
+        if not ok:
+            raise value
+        return value
+    fut = asyncio.get_running_loop().create_future()
+    _write_queue.put_nowait((fn, args, fut))
+    return await fut
+
+def _run_write_batch(batch):
+    """Alle Schreibzugriffe in einer Transaktion; jeder in einem eigenen Savepoint, damit ein Fehler nur ihn zurückrollt."""
+    results = []
+    con = get_db_connection()
+    with _db_lock:
+        # Schreibtransaktionen holen den Schreib-Lock gleich zu Beginn: ein spätes Hochstufen einer
+        # DEFERRED-Transaktion schlägt mit SQLITE_BUSY fehl, ohne dass timeout=5.0 greift
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            for fn, args, _fut in batch:
+                con.execute("SAVEPOINT w")
+                try:
+                    results.append((True, fn(*args)))
+                except Exception as e:
+                    con.execute("ROLLBACK TO w")
+                    results.append((False, e))
+                con.execute("RELEASE w")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
+    return results
+
+async def db_writer_loop():
+    global _write_queue
+    _write_queue = asyncio.Queue()
+    try:
+        while True:
+            batch = [await _write_queue.get()]
+            while len(batch) < WRITE_BATCH and not _write_queue.empty():
+                batch.append(_write_queue.get_nowait())
+            try:
+                results = await asyncio.to_thread(_run_write_batch, batch)
+            except Exception as e:
+                results = [(False, e)] * len(batch)
+            for (_fn, _args, fut), (ok, value) in zip(batch, results):
+                if fut.done():
+                    continue
+                if ok:
+                    fut.set_result(value)
+                else:
+                    fut.set_exception(value)
     finally:
-        con.close()
+        _write_queue = None
 
 DAYS = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
 MONTHS = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun", "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
 HOURS = list(range(12, 24))
+DAY_INDEX = {d: i for i, d in enumerate(DAYS)}
 
 def get_quarter_display_name() -> str:
     """Gibt z.B. 'Juli - September' zurück – genau wie bei der Verfügbarkeit."""
-    now = datetime.now(ZoneInfo(POST_TIMEZONE))
+    now = datetime.now(_TZ)
     quarter_start = get_current_quarter_start()
     
     # Im letzten Monat des Quartals → nächstes Quartal
@@ -176,7 +474,15 @@ def slot_label_range(day_short: str, hour: int) -> str:
     end = (hour + 1) % 24
     return f"{day_short}. {start:02d}:00 - {end:02d}:00 Uhr"
 
+# Alle Slot-Beschriftungen stehen fest – einmal beim Laden formatieren statt bei jedem View-Aufbau
+SLOT_LABELS = {f"{d}-{h}": slot_label_range(d, h) for d in DAYS for h in HOURS}
+# Slot-Schlüssel → (Tag, Stunde), damit Sortierung und Event-Vorbelegung nicht jedes Mal split/int brauchen
+SLOT_PARTS = {f"{d}-{h}": (d, h) for d in DAYS for h in HOURS}
+
 def format_slot_range(slot: str) -> str:
+    label = SLOT_LABELS.get(slot)
+    if label is not None:
+        return label
     try:
         day, hour_s = slot.split("-")
         return slot_label_range(day, int(hour_s))
@@ -184,7 +490,13 @@ def format_slot_range(slot: str) -> str:
         return slot
 
 def user_display_name(guild: Optional[discord.Guild], user_id: int) -> str:
+    return _cached_display_name(guild.id if guild else None, user_id)
+
+# Namen über Renders hinweg merken; Mitglieds-/Nutzer-Events leeren den Cache (forget_display_names)
+@lru_cache(maxsize=4096)
+def _cached_display_name(guild_id: Optional[int], user_id: int) -> str:
     try:
+        guild = bot.get_guild(guild_id) if guild_id is not None else None
         if guild:
             member = guild.get_member(user_id)
             if member:
@@ -194,10 +506,20 @@ def user_display_name(guild: Optional[discord.Guild], user_id: int) -> str:
     except Exception:
         return str(user_id)
 
-_WEEKDAY_MAP = {"Mo": 0, "Di": 1, "Mi": 2, "Do": 3, "Fr": 4, "Sa": 5, "So": 6}
-def next_date_for_day_short(day_short: str, tz: ZoneInfo = ZoneInfo(POST_TIMEZONE)) -> date:
+def forget_display_names():
+    _cached_display_name.cache_clear()
+    # Gerenderte Embeds, gemerkte Stimmen-Felder und RSVP-Felder enthalten die Namen
+    _rendered_polls.clear()
+    _poll_vote_fields.clear()
+    _rsvp_fields.clear()
+
+def display_names(guild: Optional[discord.Guild], user_ids) -> Dict[int, str]:
+    """Anzeigenamen für alle User eines Renders auf einmal; jeder User wird nur einmal nachgeschlagen."""
+    return {uid: user_display_name(guild, uid) for uid in set(user_ids)}
+
+def next_date_for_day_short(day_short: str, tz: ZoneInfo = _TZ) -> date:
     today = datetime.now(tz).date()
-    target = _WEEKDAY_MAP.get(day_short[:2], None)
+    target = DAY_INDEX.get(day_short[:2], None)
     if target is None:
         return today
     days_ahead = (target - today.weekday() + 7) % 7
@@ -215,7 +537,7 @@ def parse_date_ddmmyyyy(s: str) -> Optional[date]:
             d = int(d_str)
             m = int(m_str)
             if y_str == "":
-                y = datetime.now().year
+                y = datetime.now(_TZ).year
             else:
                 y = int(y_str)
                 if y < 100:
@@ -272,7 +594,7 @@ def parse_time_range(time_range_str: str) -> Tuple[Optional[_time], Optional[_ti
     return start_time, end_time
 
 def get_current_quarter_start() -> date:
-    now = datetime.now(ZoneInfo(POST_TIMEZONE)).date()
+    now = datetime.now(_TZ).date()
     year = now.year
     if now.month <= 3:
         start_month = 1
@@ -330,104 +652,172 @@ def get_week_days(week_start: date, week_end: date) -> List[str]:
         current += timedelta(days=1)
     return days
 
-def create_poll_record(poll_id: str):
-    safe_db_query("INSERT OR REPLACE INTO polls(id, created_at) VALUES (?, ?)", (poll_id, datetime.now(timezone.utc).isoformat()))
-
-def add_option(poll_id: str, option_text: str, author_id: int = None):
-    created_at = datetime.now(timezone.utc).isoformat()
-    safe_db_query("INSERT INTO options(poll_id, option_text, created_at, author_id) VALUES (?, ?, ?, ?)",
-               (poll_id, option_text, created_at, author_id))
-    rows = safe_db_query("SELECT id FROM options WHERE poll_id = ? AND option_text = ? ORDER BY id DESC LIMIT 1",
-                      (poll_id, option_text), fetch=True)
-    return rows[-1][0] if rows else None
+def create_poll_record(poll_id: str, created_at: Optional[datetime] = None):
+    if created_at is None:
+        created_at = datetime.now(timezone.utc)
+    # Vorhandene Umfrage nicht per REPLACE löschen und neu anlegen – created_at bleibt erhalten
+    safe_db_query(SQL_INSERT_POLL,
+               (poll_id, created_at.astimezone(timezone.utc).isoformat(), int(created_at.timestamp())))
+
+def add_option(poll_id: str, option_text: str, author_id: int = None, created_at: Optional[datetime] = None):
+    if created_at is None:
+        created_at = datetime.now(timezone.utc)
+    # lastrowid der geteilten Verbindung statt eines zweiten SELECT nach der neuen ID
+    with _db_lock:
+        cur = get_db_connection().execute(SQL_INSERT_OPTION,
+                                          (poll_id, option_text, created_at.astimezone(timezone.utc).isoformat(),
+                                           author_id, int(created_at.timestamp())))
+        _poll_options.pop(poll_id, None)
+        bump_poll_version(poll_id)
+        return cur.lastrowid
+
+# poll_id → Optionen; jeder View-Aufbau und Render liest sie, geändert werden sie nur über
+# add_option/delete_option, die den Eintrag unter dem DB-Lock verwerfen
+_poll_options: Dict[str, list] = {}
+MAX_CACHED_POLL_OPTIONS = 32
+
+# poll_id → Zähler, den jeder Schreibzugriff auf Ideen, Stimmen oder Zeiten der Umfrage erhöht (unter dem DB-Lock).
+# Ein gerendertes Embed bleibt gültig, solange sich der Zähler seit dem Lesen nicht geändert hat.
+_poll_versions: Dict[str, int] = defaultdict(int)
+
+def bump_poll_version(poll_id: str):
+    with _db_lock:
+        _poll_versions[poll_id] += 1
 
 def get_options(poll_id: str):
-    return safe_db_query("SELECT id, option_text, created_at, author_id FROM options WHERE poll_id = ? ORDER BY id ASC",
-                      (poll_id,), fetch=True) or []
+    with _db_lock:
+        options = _poll_options.get(poll_id)
+        if options is None:
+            options = safe_db_query(SQL_SELECT_OPTIONS, (poll_id,), fetch=True) or []
+            if len(_poll_options) >= MAX_CACHED_POLL_OPTIONS:
+                _poll_options.pop(next(iter(_poll_options)))
+            _poll_options[poll_id] = options
+        return options
 
 def get_user_options(poll_id: str, user_id: int):
-    return safe_db_query("SELECT id, option_text, created_at FROM options WHERE poll_id = ? AND author_id = ? ORDER BY id ASC",
+    return safe_db_query(SQL_SELECT_USER_OPTIONS,
                       (poll_id, user_id), fetch=True) or []
 
-def add_vote(poll_id: str, option_id: int, user_id: int):
-    try:
-        safe_db_query("INSERT OR IGNORE INTO votes(poll_id, option_id, user_id) VALUES (?, ?, ?)",
-                   (poll_id, option_id, user_id))
-    except Exception:
-        log.exception("add_vote failed")
-
-def remove_vote(poll_id: str, option_id: int, user_id: int):
-    safe_db_query("DELETE FROM votes WHERE poll_id = ? AND option_id = ? AND user_id = ?",
-               (poll_id, option_id, user_id))
+def toggle_vote(poll_id: str, option_id: int, user_id: int) -> bool:
+    """Stimme umschalten; True, wenn die Stimme jetzt gesetzt ist. Gleiches Muster wie toggle_created_event_rsvp."""
+    con = get_db_connection()
+    with _db_lock:
+        bump_poll_version(poll_id)
+        if con.execute(SQL_INSERT_VOTE,
+                       (poll_id, option_id, user_id)).rowcount == 0:
+            con.execute(SQL_DELETE_VOTE, (poll_id, option_id, user_id))
+            return False
+    return True
+
+def toggle_vote_voters(poll_id: str, option_id: int, user_id: int) -> List[int]:
+    """Stimme umschalten und die Abstimmenden der Idee im selben Schreibzugriff zurückgeben."""
+    toggle_vote(poll_id, option_id, user_id)
+    rows = get_db_connection().execute(SQL_SELECT_OPTION_VOTERS,
+                                       (poll_id, option_id)).fetchall()
+    return [uid for (uid,) in rows]
+
+def delete_option(poll_id: str, option_id: int):
+    """Idee samt ihren Stimmen in einer Transaktion löschen."""
+    # Mit poll_id nutzt das Löschen der Stimmen den Primärschlüssel (poll_id, option_id, user_id)
+    # statt die ganze votes-Tabelle zu scannen
+    with _db_lock:
+        safe_db_transaction([
+            (SQL_DELETE_OPTION_VOTES, (poll_id, option_id)),
+            (SQL_DELETE_OPTION, (option_id,)),
+        ])
+        _poll_options.pop(poll_id, None)
+        bump_poll_version(poll_id)
 
 def get_votes_for_poll(poll_id: str):
-    return safe_db_query("SELECT option_id, user_id FROM votes WHERE poll_id = ?", (poll_id,), fetch=True) or []
+    return safe_db_query(SQL_SELECT_POLL_VOTES, (poll_id,), fetch=True) or []
 
 def persist_availability(poll_id: str, user_id: int, slots: list):
-    safe_db_query("DELETE FROM availability WHERE poll_id = ? AND user_id = ?", (poll_id, user_id))
+    """Zeiten eines Nutzers ersetzen – für db_write, läuft also in dessen offener Transaktion.
+
+    Löschen und Neuschreiben teilen sich einen Commit; ein paralleler Leser sieht nie kurz gar keine Zeiten.
+    """
+    con = get_db_connection()
+    # Zeiten gehen nur in die Matches ein, das gerenderte Embed mit Matches wird aber damit ungültig
+    bump_poll_version(poll_id)
+    con.execute(SQL_DELETE_USER_AVAILABILITY, (poll_id, user_id))
     if slots:
-        safe_db_query("INSERT OR IGNORE INTO availability(poll_id, user_id, slot) VALUES (?, ?, ?)",
-                   [(poll_id, user_id, s) for s in slots], many=True)
+        con.executemany(SQL_INSERT_AVAILABILITY, [(poll_id, user_id, s) for s in slots])
 
 def get_availability_for_poll(poll_id: str):
-    return safe_db_query("SELECT user_id, slot FROM availability WHERE poll_id = ?", (poll_id,), fetch=True) or []
+    return safe_db_query(SQL_SELECT_POLL_AVAILABILITY, (poll_id,), fetch=True) or []
 
 def get_options_since(poll_id: str, since_dt: datetime):
-    rows = safe_db_query("SELECT option_text, created_at FROM options WHERE poll_id = ? AND created_at >= ? ORDER BY created_at ASC",
-                      (poll_id, since_dt.isoformat()), fetch=True)
+    rows = safe_db_query(SQL_SELECT_OPTIONS_SINCE,
+                      (poll_id, int(since_dt.timestamp())), fetch=True)
     return rows or []
 
-def compute_matches_for_poll_from_db(poll_id: str):
-    options = get_options(poll_id)
-    votes = get_votes_for_poll(poll_id)
-    votes_map = {}
+def load_poll_rows(poll_id: str, with_matches: bool = False):
+    """Optionen, Stimmen und (falls angezeigt) Matches unter einer Lock-Übernahme lesen."""
+    with _db_lock:
+        options = get_options(poll_id)
+        votes = get_votes_for_poll(poll_id)
+        matches = None
+        if with_matches:
+            # Ohne Stimmen kann es keine Matches geben – der JOIN über die Verfügbarkeiten entfällt
+            matches = compute_matches_for_poll_from_db(poll_id) if votes else {}
+    return options, votes, matches
+
+SQL_SELECT_MATCH_SLOTS = """
+    SELECT oid, option_text, slot, GROUP_CONCAT(user_id) FROM (
+        SELECT o.id AS oid, o.option_text, a.slot, v.user_id
+        FROM options o
+        JOIN votes v ON v.poll_id = o.poll_id AND v.option_id = o.id
+        JOIN availability a ON a.poll_id = o.poll_id AND a.user_id = v.user_id
+        WHERE o.poll_id = ?
+        ORDER BY o.id, a.slot, v.user_id)
+    GROUP BY oid, slot
+    HAVING COUNT(*) >= 2
+    ORDER BY oid
+"""
+
+def _match_slot_key(info):
+    """Sort best by slot chronologically"""
+    slot = info["slot"]
+    parts = SLOT_PARTS.get(slot)
+    if parts is not None:
+        day, hour = parts
+        return (DAY_INDEX[day], hour)
+    else:
+        # For quarterly, assume date format like "Mo. 01.01."
+        try:
+            parts = slot.split(". ")
+            if len(parts) > 1:
+                date_str = parts[1]
+                d = parse_date_ddmmyyyy(date_str)
+                return (d.weekday(), 0) if d else (7, 0)
+        except:
+            pass
+        return (7, 0)
+
+def _best_slots(common_slots: list) -> list:
+    """Nur die Slots mit den meisten Teilnehmern, chronologisch sortiert."""
+    max_count = max(len(info["users"]) for info in common_slots)
+    best = [info for info in common_slots if len(info["users"]) == max_count]
+    best.sort(key=_match_slot_key)
+    return best
+
+def votes_by_option(votes) -> Dict[int, List[int]]:
+    """option_id → Abstimmende; einmal pro Render aus den (option_id, user_id)-Zeilen gebaut."""
+    votes_map = defaultdict(list)
     for opt_id, uid in votes:
-        votes_map.setdefault(opt_id, []).append(uid)
-    availability_rows = get_availability_for_poll(poll_id)
-    avail_map = {}
-    for uid, slot in availability_rows:
-        avail_map.setdefault(uid, set()).add(slot)
-    results = {}
-    for opt_id, opt_text, _created, _author in options:
-        voters = votes_map.get(opt_id, [])
-        if len(voters) < 2:
-            continue
-        slot_to_users = {}
-        for u in voters:
-            for s in avail_map.get(u, set()):
-                slot_to_users.setdefault(s, []).append(u)
-        common_slots = []
-        for s, users in slot_to_users.items():
-            if len(users) >= 2:
-                common_slots.append({"slot": s, "users": users})
-        if common_slots:
-            max_count = max(len(info["users"]) for info in common_slots)
-            best = [info for info in common_slots if len(info["users"]) == max_count]
-            # Sort best by slot chronologically
-            def sort_key(info):
-                slot = info["slot"]
-                if "-" in slot:
-                    day, hour_s = slot.split("-")
-                    day_idx = _WEEKDAY_MAP.get(day[:2], 7)
-                    hour = int(hour_s)
-                    return (day_idx, hour)
-                else:
-                    # For quarterly, assume date format like "Mo. 01.01."
-                    try:
-                        parts = slot.split(". ")
-                        if len(parts) > 1:
-                            date_str = parts[1]
-                            d = parse_date_ddmmyyyy(date_str)
-                            return (d.weekday(), 0) if d else (7, 0)
-                    except:
-                        pass
-                    return (7, 0)
-            best.sort(key=sort_key)
-            results[opt_text] = best
-    return results
+        votes_map[opt_id].append(uid)
+    return votes_map
+
+def compute_matches_for_poll_from_db(poll_id: str):
+    """SQLite rechnet Stimmen × Verfügbarkeiten per JOIN/GROUP BY über die Primärschlüssel zusammen,
+    statt alle drei Tabellen nach Python zu holen. Ergebnis: Ideentext → beste gemeinsame Slots."""
+    per_option: Dict[int, Tuple[str, list]] = {}
+    for opt_id, opt_text, slot, users_csv in safe_db_query(SQL_SELECT_MATCH_SLOTS, (poll_id,), fetch=True) or []:
+        per_option.setdefault(opt_id, (opt_text, []))[1].append({"slot": slot, "users": parse_id_csv(users_csv)})
+    return {opt_text: _best_slots(common_slots) for opt_text, common_slots in per_option.values()}
 
 def get_last_posted_matches(poll_id: str):
-    rows = safe_db_query("SELECT matches FROM last_posted_matches WHERE poll_id = ?", (poll_id,), fetch=True)
+    rows = safe_db_query(SQL_SELECT_LAST_POSTED_MATCHES, (poll_id,), fetch=True)
     if rows:
         import json
         return json.loads(rows[0][0])
@@ -436,12 +826,12 @@ def get_last_posted_matches(poll_id: str):
 def set_last_posted_matches(poll_id: str, matches: dict):
     import json
     matches_str = json.dumps(matches)
-    now = datetime.now(timezone.utc).isoformat()
-    safe_db_query("INSERT OR REPLACE INTO last_posted_matches(poll_id, matches, updated_at) VALUES (?, ?, ?)",
+    now = int(time.time())
+    safe_db_query(SQL_UPSERT_LAST_POSTED_MATCHES,
                (poll_id, matches_str, now))
 
 def get_last_posted_weekly_matches(poll_id: str):
-    rows = safe_db_query("SELECT matches FROM last_posted_weekly_matches WHERE poll_id = ?", (poll_id,), fetch=True)
+    rows = safe_db_query(SQL_SELECT_LAST_POSTED_WEEKLY_MATCHES, (poll_id,), fetch=True)
     if rows:
         import json
         return json.loads(rows[0][0])
@@ -450,40 +840,139 @@ def get_last_posted_weekly_matches(poll_id: str):
 def set_last_posted_weekly_matches(poll_id: str, matches: dict):
     import json
     matches_str = json.dumps(matches)
-    now = datetime.now(timezone.utc).isoformat()
-    safe_db_query("INSERT OR REPLACE INTO last_posted_weekly_matches(poll_id, matches, updated_at) VALUES (?, ?, ?)",
+    now = int(time.time())
+    safe_db_query(SQL_UPSERT_LAST_POSTED_WEEKLY_MATCHES,
                (poll_id, matches_str, now))
 
-def generate_poll_embed_from_db(poll_id: str, guild: Optional[discord.Guild] = None, show_matches_flag: bool = False):
-    options = get_options(poll_id)
-    votes = get_votes_for_poll(poll_id)
-    votes_map = {}
-    for opt_id, uid in votes:
-        votes_map.setdefault(opt_id, []).append(uid)
+def diff_matches(current_matches: dict, last_matches: dict) -> dict:
+    """Slots aus current_matches, die beim letzten Post noch nicht dabei waren.
+    Die geposteten Slots je Idee einmal als Set aus (slot, users) – jede Prüfung ist dann ein Hash-Lookup
+    statt eines Vergleichs gegen die ganze Liste."""
+    new_matches = {}
+    for key, infos in current_matches.items():
+        if key not in last_matches:
+            new_matches[key] = infos
+            continue
+        posted = {(info["slot"], tuple(info["users"])) for info in last_matches[key]}
+        fresh = [info for info in infos if (info["slot"], tuple(info["users"])) not in posted]
+        if fresh:
+            new_matches[key] = fresh
+    return new_matches
+
+async def poll_embed_async(poll_id: str, guild: Optional[discord.Guild], quarterly: Optional[bool] = None,
+                           show_matches_flag: Optional[bool] = None, use_next_quarter: bool = False) -> discord.Embed:
+    """Liest die Umfragedaten im Thread-Pool und baut das Embed auf dem Event-Loop."""
+    if quarterly is None:
+        quarterly = "_quarterly" in poll_id
+    if show_matches_flag is None:
+        show_matches_flag = show_matches.get(poll_id, False)
+    # Der Quartalstitel hängt vom Datum ab – er gehört zum Schlüssel, sonst liefert ein Treffer
+    # nach dem Quartalswechsel den alten Titel
+    render_key = (poll_id, show_matches_flag, quarterly_poll_title(use_next_quarter) if quarterly else None)
+    # Stand vor dem Lesen merken: ein Schreibzugriff während des Renders macht das Ergebnis sofort ungültig
+    version = _poll_versions[poll_id]
+    cached = _rendered_polls.get(render_key)
+    if cached is not None and cached[0] == version:
+        _, data, index = cached
+        if show_matches_flag:
+            _poll_vote_fields.pop(poll_id, None)
+        else:
+            remember_vote_fields(poll_id, data, index)
+        return discord.Embed.from_dict(data)
+    rows = await asyncio.to_thread(load_poll_rows, poll_id, show_matches_flag)
+    if quarterly:
+        embed = generate_quarterly_poll_embed_from_db(poll_id, guild, show_matches_flag=show_matches_flag,
+                                                      use_next_quarter=use_next_quarter, rows=rows)
+    else:
+        embed = generate_poll_embed_from_db(poll_id, guild, show_matches_flag=show_matches_flag, rows=rows)
+    data = embed_snapshot(embed)
+    index = vote_field_index(rows[0])
+    if render_key not in _rendered_polls and len(_rendered_polls) >= MAX_RENDERED_POLLS:
+        _rendered_polls.pop(next(iter(_rendered_polls)))
+    _rendered_polls[render_key] = (version, data, index)
+    if show_matches_flag:
+        _poll_vote_fields.pop(poll_id, None)
+    else:
+        remember_vote_fields(poll_id, data, index)
+    return embed
+
+MAX_FIELDS = 20  # Ideen-Felder pro Embed; Puffer für Matches
+
+def votes_field_value(voters: List[int], names: Dict[int, str]) -> str:
+    count = len(voters)
+    header = f"🗳️ {count} Stimme{'n' if count != 1 else ''}"
+    if voters:
+        names_line = ", ".join(names[uid] for uid in voters[:8]) + (f" +{len(voters)-8}" if len(voters) > 8 else "")
+        return f"{header}\n👥 {names_line}"
+    return f"{header}\n👥 Keine Stimmen"
+
+NO_VOTES_FIELD_VALUE = votes_field_value([], {})
+
+# poll_id → (Embed als dict, option_id → Feldindex) des letzten Renders ohne Matches.
+# Eine Stimme ändert dann nur ihr eigenes Feld; neue/gelöschte Ideen verwerfen den Eintrag.
+_poll_vote_fields: Dict[str, Tuple[dict, Dict[int, int]]] = {}
+MAX_POLL_VOTE_FIELDS = 32
+
+# (poll_id, Matches an, Quartalstitel) → (_poll_versions-Stand, Embed als dict, Feldindex).
+# Matches ein-/ausblenden oder !rerenderpoll ohne neue Daten liest und rendert dann nichts neu.
+_rendered_polls: Dict[tuple, Tuple[int, dict, Dict[int, int]]] = {}
+MAX_RENDERED_POLLS = 32
+
+def embed_snapshot(embed: discord.Embed) -> dict:
+    """Embed als dict mit eigener Feldliste – to_dict teilt sie sonst mit dem Embed, das der Aufrufer erhält."""
+    data = embed.to_dict()
+    data["fields"] = list(data.get("fields", []))
+    return data
+
+def vote_field_index(options: list) -> Dict[int, int]:
+    return {opt_id: i for i, (opt_id, *_rest) in enumerate(options[:MAX_FIELDS])}
+
+def remember_vote_fields(poll_id: str, data: dict, index: Dict[int, int]):
+    if poll_id not in _poll_vote_fields and len(_poll_vote_fields) >= MAX_POLL_VOTE_FIELDS:
+        _poll_vote_fields.pop(next(iter(_poll_vote_fields)))
+    _poll_vote_fields[poll_id] = (data, index)
+
+async def vote_embed_async(poll_id: str, option_id: int, guild: Optional[discord.Guild], quarterly: bool,
+                           voters: Optional[List[int]] = None) -> discord.Embed:
+    """Embed nach einer Stimme: nur das Feld der Idee neu, solange keine Matches angezeigt werden."""
+    cached = _poll_vote_fields.get(poll_id)
+    if cached is None or show_matches.get(poll_id, False):
+        return await poll_embed_async(poll_id, guild, quarterly=quarterly)
+    data, index = cached
+    i = index.get(option_id)
+    if i is not None:
+        if voters is None:
+            rows = await db_query_async(SQL_SELECT_OPTION_VOTERS,
+                                        (poll_id, option_id), fetch=True)
+            voters = [uid for (uid,) in rows or []]
+        fields = list(data["fields"])
+        fields[i] = {**fields[i], "value": votes_field_value(voters, display_names(guild, voters[:8]))}
+        data = {**data, "fields": fields}
+        _poll_vote_fields[poll_id] = (data, index)
+    return discord.Embed.from_dict(data)
+
+def generate_poll_embed_from_db(poll_id: str, guild: Optional[discord.Guild] = None, show_matches_flag: bool = False, rows=None):
+    options, votes, matches = rows if rows is not None else load_poll_rows(poll_id, show_matches_flag)
+    votes_map = votes_by_option(votes)
 
     embed = discord.Embed(
         title="📋 Worauf hast du diese Woche Lust?",
         description="Gib eigene Ideen ein, stimme ab oder trage deine Zeiten ein!\n\n",
-        color=discord.Color.blurple()
+        color=_COLOR_BLURPLE
     )
 
     # === Optionen begrenzen ===
-    MAX_FIELDS = 20  # Puffer für Matches
     displayed_options = options[:MAX_FIELDS]
-
-    for opt_id, opt_text, _created, author_id in displayed_options:
-        voters = votes_map.get(opt_id, [])
-        count = len(voters)
-        header = f"🗳️ {count} Stimme{'n' if count != 1 else ''}"
-        
-        if voters:
-            names = [user_display_name(guild, uid) for uid in voters]
-            names_line = ", ".join(names[:8]) + (f" +{len(names)-8}" if len(names) > 8 else "")
-            value = f"{header}\n👥 {names_line}"
-        else:
-            value = f"{header}\n👥 Keine Stimmen"
-
-        embed.add_field(name=opt_text or "(ohne Titel)", value=value, inline=False)
+    if votes:
+        # Nur angezeigte Namen auflösen: höchstens 8 Abstimmende pro sichtbarer Idee
+        names = display_names(guild, (uid for opt_id, *_ in displayed_options for uid in votes_map.get(opt_id, ())[:8]))
+        for opt_id, opt_text, _created, author_id in displayed_options:
+            embed.add_field(name=opt_text or "(ohne Titel)", value=votes_field_value(votes_map.get(opt_id, []), names), inline=False)
+    else:
+        # Frische Umfrage: alle Felder gleich, keine Namen nachzuschlagen
+        names = {}
+        for _opt_id, opt_text, _created, _author_id in displayed_options:
+            embed.add_field(name=opt_text or "(ohne Titel)", value=NO_VOTES_FIELD_VALUE, inline=False)
 
     if len(options) > MAX_FIELDS:
         embed.add_field(
@@ -494,18 +983,19 @@ def generate_poll_embed_from_db(poll_id: str, guild: Optional[discord.Guild] = N
 
     # === Matches ===
     if show_matches_flag:
-        matches = compute_matches_for_poll_from_db(poll_id)
         if matches:
             match_count = 0
-            for opt_text, infos in list(matches.items())[:5]:  # max 5 Matches
+            shown_matches = list(matches.items())[:5]  # max 5 Matches
+            names.update(display_names(guild, (u for _opt_text, infos in shown_matches for info in infos[:3]
+                                               for u in info["users"][:6] if u not in names)))
+            for opt_text, infos in shown_matches:
                 if match_count >= 5:
                     break
                 lines = []
                 for info in infos[:3]:  # max 3 Slots pro Idee
                     slot = info["slot"]
-                    time_str = slot_label_range(*slot.split("-")) if "-" in slot else slot
-                    names = [user_display_name(guild, u) for u in info["users"][:6]]
-                    lines.append(f"{time_str}: {', '.join(names)}")
+                    time_str = format_slot_range(slot)
+                    lines.append(f"{time_str}: {', '.join(names[u] for u in info['users'][:6])}")
                 embed.add_field(
                     name=f"🤝 Beste Matches — {opt_text[:80]}",
                     value="\n".join(lines) or "—",
@@ -520,41 +1010,36 @@ def generate_poll_embed_from_db(poll_id: str, guild: Optional[discord.Guild] = N
 
     return embed
 
-def generate_quarterly_poll_embed_from_db(poll_id: str, guild: Optional[discord.Guild] = None, 
-                                          show_matches_flag: bool = False, use_next_quarter: bool = False):
-    options = get_options(poll_id)
-    votes = get_votes_for_poll(poll_id)
-    votes_map = {}
-    for opt_id, uid in votes:
-        votes_map.setdefault(opt_id, []).append(uid)
-
+def quarterly_poll_title(use_next_quarter: bool = False) -> str:
+    """Titel der Quartalsumfrage; hängt vom heutigen Datum ab."""
     quarter_start = get_current_quarter_start()
     if use_next_quarter:
         quarter_start = get_next_quarter_start(quarter_start)
+    return f"📋 Quartalsumfrage {get_quarter_display_name()} {quarter_start.year}"
+
+def generate_quarterly_poll_embed_from_db(poll_id: str, guild: Optional[discord.Guild] = None, 
+                                          show_matches_flag: bool = False, use_next_quarter: bool = False, rows=None):
+    options, votes, matches = rows if rows is not None else load_poll_rows(poll_id, show_matches_flag)
+    votes_map = votes_by_option(votes)
 
     embed = discord.Embed(
-        title=f"📋 Quartalsumfrage {get_quarter_display_name()} {quarter_start.year}",
+        title=quarterly_poll_title(use_next_quarter),
         description="Gib eigene Ideen ein, stimme ab oder trage deine verfügbaren Tage ein!\n\n",
-        color=discord.Color.blurple()
+        color=_COLOR_BLURPLE
     )
 
     # === Optionen begrenzen ===
-    MAX_FIELDS = 20  # Puffer für Matches
     displayed_options = options[:MAX_FIELDS]
-
-    for opt_id, opt_text, _created, author_id in displayed_options:
-        voters = votes_map.get(opt_id, [])
-        count = len(voters)
-        header = f"🗳️ {count} Stimme{'n' if count != 1 else ''}"
-        
-        if voters:
-            names = [user_display_name(guild, uid) for uid in voters]
-            names_line = ", ".join(names[:8]) + (f" +{len(names)-8}" if len(names) > 8 else "")
-            value = f"{header}\n👥 {names_line}"
-        else:
-            value = f"{header}\n👥 Keine Stimmen"
-
-        embed.add_field(name=opt_text or "(ohne Titel)", value=value, inline=False)
+    if votes:
+        # Nur angezeigte Namen auflösen: höchstens 8 Abstimmende pro sichtbarer Idee
+        names = display_names(guild, (uid for opt_id, *_ in displayed_options for uid in votes_map.get(opt_id, ())[:8]))
+        for opt_id, opt_text, _created, author_id in displayed_options:
+            embed.add_field(name=opt_text or "(ohne Titel)", value=votes_field_value(votes_map.get(opt_id, []), names), inline=False)
+    else:
+        # Frische Umfrage: alle Felder gleich, keine Namen nachzuschlagen
+        names = {}
+        for _opt_id, opt_text, _created, _author_id in displayed_options:
+            embed.add_field(name=opt_text or "(ohne Titel)", value=NO_VOTES_FIELD_VALUE, inline=False)
 
     if len(options) > MAX_FIELDS:
         embed.add_field(
@@ -565,18 +1050,19 @@ def generate_quarterly_poll_embed_from_db(poll_id: str, guild: Optional[discord.
 
     # === Matches ===
     if show_matches_flag:
-        matches = compute_matches_for_poll_from_db(poll_id)
         if matches:
             match_count = 0
-            for opt_text, infos in list(matches.items())[:5]:  # max 5 Matches
+            shown_matches = list(matches.items())[:5]  # max 5 Matches
+            names.update(display_names(guild, (u for _opt_text, infos in shown_matches for info in infos[:3]
+                                               for u in info["users"][:6] if u not in names)))
+            for opt_text, infos in shown_matches:
                 if match_count >= 5:
                     break
                 lines = []
                 for info in infos[:3]:  # max 3 Slots pro Idee
                     slot = info["slot"]
-                    time_str = slot if "-" not in slot else slot_label_range(*slot.split("-"))
-                    names = [user_display_name(guild, u) for u in info["users"][:6]]
-                    lines.append(f"{time_str}: {', '.join(names)}")
+                    time_str = format_slot_range(slot)
+                    lines.append(f"{time_str}: {', '.join(names[u] for u in info['users'][:6])}")
                 embed.add_field(
                     name=f"🤝 Beste Matches — {opt_text[:80]}",
                     value="\n".join(lines) or "—",
@@ -591,9 +1077,112 @@ def generate_quarterly_poll_embed_from_db(poll_id: str, guild: Optional[discord.
 
     return embed
                                               
-temp_selections: Dict[str, Dict[int, Set[str]]] = {}
+# (poll_id, user_id) → noch nicht abgesendete Auswahl; ein Schlüssel statt verschachtelter Dicts pro Umfrage
+temp_selections: Dict[Tuple[str, int], Set[str]] = {}
 create_event_temp_storage: Dict[str, Dict] = {}
+
+async def load_user_selection(poll_id: str, user_id: int) -> Set[str]:
+    """Offene Auswahl eines Nutzers; beim ersten Zugriff der Sitzung mit den gespeicherten Slots vorbelegt.
+    Eine leer geklickte Auswahl bleibt leer und holt die gespeicherten Zeiten nicht wieder herein."""
+    key = (poll_id, user_id)
+    selection = temp_selections.get(key)
+    if selection is None:
+        persisted = await db_query_async(SQL_SELECT_USER_SLOTS, key, fetch=True)
+        selection = temp_selections.setdefault(key, {r[0] for r in persisted or [] if r})
+    return selection
 show_matches: Dict[str, bool] = {}
+# poll_id → (channel_id, message_id) der geposteten Umfrage; erspart den history()-Scan beim Aktualisieren.
+# In poll_messages gespiegelt, damit die Zuordnung einen Neustart übersteht.
+_poll_messages: Dict[str, Tuple[int, int]] = {}
+
+def store_poll_message(poll_id: str, channel_id: int, message_id: int):
+    safe_db_query(SQL_UPSERT_POLL_MESSAGE,
+               (poll_id, channel_id, message_id))
+
+def remember_poll_message(poll_id: str, message: discord.Message):
+    location = (message.channel.id, message.id)
+    if _poll_messages.get(poll_id) == location:
+        return
+    _poll_messages[poll_id] = location
+    spawn_background(db_write(store_poll_message, poll_id, *location), name=f"Store message of poll {poll_id}")
+
+def forget_poll_message(poll_id: str):
+    if _poll_messages.pop(poll_id, None) is not None:
+        spawn_background(db_write(safe_db_query, SQL_DELETE_POLL_MESSAGE, (poll_id,)),
+                         name=f"Forget message of poll {poll_id}")
+
+# So weit wird der Kanalverlauf nach einer unbekannten Umfrage-Nachricht durchsucht
+POLL_SCAN_LIMIT = 50
+
+def is_poll_message(msg: discord.Message, poll_id: str) -> bool:
+    """Erkennt die Nachricht genau dieser Umfrage an den custom_ids ihrer Buttons (z.B. "addopt:<poll_id>")."""
+    if msg.author != bot.user:
+        return False
+    suffix = f":{poll_id}"
+    for row in msg.components:
+        for child in getattr(row, "children", ()):
+            custom_id = getattr(child, "custom_id", None) or ""
+            if custom_id.endswith(suffix) or f"{suffix}:" in custom_id:
+                return True
+    return False
+
+async def find_poll_message(channel: discord.abc.Messageable, poll_id: str) -> Optional[discord.Message]:
+    async for msg in channel.history(limit=POLL_SCAN_LIMIT):
+        if is_poll_message(msg, poll_id):
+            return msg
+    return None
+
+async def refresh_poll_message(poll_id: str, channel: Optional[discord.abc.Messageable], guild: Optional[discord.Guild]):
+    """Embed und Buttons der Umfrage nach geänderten Optionen neu setzen."""
+    is_weekly = "_quarterly" not in poll_id
+    known = _poll_messages.get(poll_id)
+    if known:
+        target = bot.get_partial_messageable(known[0]).get_partial_message(known[1])
+    elif channel:
+        # Fallback für Umfragen, die vor dem Start des Bots gepostet wurden
+        target = await find_poll_message(channel, poll_id)
+        if target is None:
+            return
+    else:
+        return
+    embed = await poll_embed_async(poll_id, guild, quarterly=not is_weekly)
+    view = PollView(poll_id) if is_weekly else QuarterlyPollView(poll_id)
+    bot.add_view(view)
+    try:
+        await target.edit(embed=embed, view=view)
+    except discord.NotFound:
+        forget_poll_message(poll_id)
+        return
+    remember_poll_message(poll_id, target)
+
+POLL_REFRESH_DELAY = 0.5
+_poll_refresh_tasks: Dict[str, asyncio.Task] = {}
+_poll_refresh_dirty: Set[str] = set()
+
+def request_poll_refresh(poll_id: str, channel: Optional[discord.abc.Messageable], guild: Optional[discord.Guild]):
+    """Mehrere Ideen kurz hintereinander hinzugefügt oder gelöscht ergeben nur einen Edit der Umfrage."""
+    # Feldindizes stimmen nicht mehr, bis der Refresh neu rendert
+    _poll_vote_fields.pop(poll_id, None)
+    if poll_id in _poll_refresh_tasks:
+        _poll_refresh_dirty.add(poll_id)
+        return
+    _poll_refresh_tasks[poll_id] = spawn_background(
+        _refresh_poll_later(poll_id, channel, guild), name=f"Poll refresh for {poll_id}")
+
+async def _refresh_poll_later(poll_id: str, channel: Optional[discord.abc.Messageable], guild: Optional[discord.Guild]):
+    try:
+        while True:
+            await asyncio.sleep(POLL_REFRESH_DELAY)
+            _poll_refresh_dirty.discard(poll_id)
+            try:
+                await refresh_poll_message(poll_id, channel, guild)
+            except discord.HTTPException as e:
+                log.warning("Failed refreshing poll message %s: %s", poll_id, e)
+            # Während des Edits eingetroffene Änderungen brauchen noch einen Durchlauf
+            if poll_id not in _poll_refresh_dirty:
+                break
+    finally:
+        _poll_refresh_tasks.pop(poll_id, None)
 
 class SuggestModal(discord.ui.Modal, title="Neue Idee hinzufügen"):
     idea = discord.ui.TextInput(label="Deine Idee", placeholder="z. B. Minecraft zocken", max_length=100)
@@ -608,26 +1197,16 @@ class SuggestModal(discord.ui.Modal, title="Neue Idee hinzufügen"):
             except Exception:
                 pass
             return
-        add_option(self.poll_id, text, author_id=interaction.user.id)
-        try:
-            if interaction.channel:
-                async for msg in interaction.channel.history(limit=200):
-                    if msg.author == bot.user and msg.embeds:
-                        em = msg.embeds[0]
-                        if "Worauf" in em.title or "Quartalsumfrage" in em.title:
-                            embed = generate_poll_embed_from_db(self.poll_id, interaction.guild, show_matches_flag=show_matches.get(self.poll_id, False)) if "Worauf" in em.title else generate_quarterly_poll_embed_from_db(self.poll_id, interaction.guild, show_matches_flag=show_matches.get(self.poll_id, False))
-                            try:
-                                bot.add_view(PollView(self.poll_id) if "Worauf" in em.title else QuarterlyPollView(self.poll_id))
-                            except Exception:
-                                pass
-                            await msg.edit(embed=embed, view=PollView(self.poll_id) if "Worauf" in em.title else QuarterlyPollView(self.poll_id))
-                            break
-        except Exception:
-            log.exception("Best-effort update failed")
+        # Erst bestätigen, dann schreiben: die Antwortfrist von Discord hängt nicht am Datenbank-Lock
         try:
             await interaction.response.defer(ephemeral=True)
         except Exception:
             pass
+        await db_write(add_option, self.poll_id, text, interaction.user.id)
+        # Das Modal kommt vom Button der Umfrage-Nachricht, die damit direkt bekannt ist
+        if interaction.message:
+            remember_poll_message(self.poll_id, interaction.message)
+        request_poll_refresh(self.poll_id, interaction.channel, interaction.guild)
 
 class AddOptionButton(discord.ui.Button):
     def __init__(self, poll_id: str):
@@ -648,36 +1227,43 @@ class DaySelectButton(discord.ui.Button):
         self.poll_id = poll_id
         self.day_index = day_index
     async def callback(self, interaction: discord.Interaction):
-        new_view = AvailabilityDayView(self.poll_id, day_index=self.day_index, for_user=interaction.user.id)
+        view = self.view
+        # Nach "Absenden" ist der Eintrag in temp_selections weg – die Auswahl kommt dann wieder aus der DB
+        selection = await load_user_selection(self.poll_id, interaction.user.id)
+        if isinstance(view, AvailabilityDayView) and view.for_user == interaction.user.id:
+            # Tageswechsel in der bestehenden View: nur Farben und Stunden-Buttons umstellen
+            view.show_day(self.day_index, selection)
+        else:
+            view = AvailabilityDayView(self.poll_id, day_index=self.day_index, for_user=interaction.user.id,
+                                       selection=selection)
         try:
-            await interaction.response.edit_message(view=new_view)
+            await interaction.response.edit_message(view=view)
         except Exception:
             pass
 
 class HourButton(discord.ui.Button):
     def __init__(self, poll_id: str, day: str, hour: int):
-        label = slot_label_range(day, hour)
+        self.slot = f"{day}-{hour}"
         custom_id = f"hour:{poll_id}:{day}:{hour}"
-        super().__init__(label=label, style=discord.ButtonStyle.secondary, custom_id=custom_id)
+        super().__init__(label=SLOT_LABELS[self.slot], style=discord.ButtonStyle.secondary, custom_id=custom_id)
         self.poll_id = poll_id
         self.day = day
         self.hour = hour
-        self.slot = f"{day}-{hour}"
+    def set_day(self, day: str):
+        self.day = day
+        self.slot = f"{day}-{self.hour}"
+        self.label = SLOT_LABELS[self.slot]
+        self.custom_id = f"hour:{self.poll_id}:{day}:{self.hour}"
     async def callback(self, interaction: discord.Interaction):
-        uid = interaction.user.id
-        _tmp = temp_selections.setdefault(self.poll_id, {})
-        user_tmp = _tmp.setdefault(uid, set())
-        if not user_tmp:
-            persisted = safe_db_query("SELECT slot FROM availability WHERE poll_id = ? AND user_id = ?", (self.poll_id, uid), fetch=True)
-            user_tmp.update(r[0] for r in persisted if r)
+        user_tmp = await load_user_selection(self.poll_id, interaction.user.id)
         if self.slot in user_tmp:
             user_tmp.remove(self.slot)
         else:
             user_tmp.add(self.slot)
-        day_index = getattr(self.view, "day_index", 0)
-        new_view = AvailabilityDayView(self.poll_id, day_index=day_index, for_user=uid)
+        # Nur dieser Button ändert sich: die bestehende (nutzereigene) View anpassen statt alle Buttons neu zu bauen
+        self.style = discord.ButtonStyle.success if self.slot in user_tmp else discord.ButtonStyle.secondary
         try:
-            await interaction.response.edit_message(view=new_view)
+            await interaction.response.edit_message(view=self.view)
         except Exception:
             pass
 
@@ -687,12 +1273,13 @@ class SubmitButton(discord.ui.Button):
         self.poll_id = poll_id
     async def callback(self, interaction: discord.Interaction):
         uid = interaction.user.id
-        user_tmp = temp_selections.get(self.poll_id, {}).get(uid, set())
-        persist_availability(self.poll_id, uid, list(user_tmp))
-        if self.poll_id in temp_selections and uid in temp_selections[self.poll_id]:
-            temp_selections[self.poll_id].pop(uid, None)
+        user_tmp = temp_selections.get((self.poll_id, uid), set())
+        await db_write(persist_availability, self.poll_id, uid, list(user_tmp))
+        # Gespeichert: der Eintrag wird nicht mehr gebraucht. Die View zeigt die lokale Auswahl,
+        # der nächste Klick lädt sie per load_user_selection wieder aus der DB.
+        temp_selections.pop((self.poll_id, uid), None)
         try:
-            await interaction.response.edit_message(view=AvailabilityDayView(self.poll_id, day_index=getattr(self.view, "day_index", 0), for_user=uid))
+            await interaction.response.edit_message(view=availability_view_for(self.view, self.poll_id, uid, user_tmp))
         except Exception:
             try:
                 await interaction.response.defer(ephemeral=True)
@@ -709,11 +1296,12 @@ class RemovePersistedButton(discord.ui.Button):
         self.poll_id = poll_id
     async def callback(self, interaction: discord.Interaction):
         uid = interaction.user.id
-        safe_db_query("DELETE FROM availability WHERE poll_id = ? AND user_id = ?", (self.poll_id, uid))
-        if self.poll_id in temp_selections:
-            temp_selections[self.poll_id].pop(uid, None)
+        # Gleicher Schreibweg wie "Absenden", nur mit leerer Auswahl
+        await db_write(persist_availability, self.poll_id, uid, [])
+        # Die Auswahl ist jetzt bekannt leer – die View braucht dafür weder DB noch einen Eintrag in temp_selections
+        temp_selections.pop((self.poll_id, uid), None)
         try:
-            await interaction.response.edit_message(view=AvailabilityDayView(self.poll_id, day_index=getattr(self.view, "day_index", 0), for_user=uid))
+            await interaction.response.edit_message(view=availability_view_for(self.view, self.poll_id, uid, set()))
         except Exception:
             try:
                 await interaction.response.defer(ephemeral=True)
@@ -721,29 +1309,24 @@ class RemovePersistedButton(discord.ui.Button):
                 pass
 
 class AvailabilityDayView(discord.ui.View):
-    def __init__(self, poll_id: str, day_index: int = 0, for_user: int = None):
+    def __init__(self, poll_id: str, day_index: int = 0, for_user: int = None, selection: Optional[Set[str]] = None):
         super().__init__(timeout=None)
         self.poll_id = poll_id
         self.day_index = day_index
         self.for_user = for_user
-        if for_user is not None:
-            pst = temp_selections.setdefault(poll_id, {})
-            if for_user not in pst:
-                persisted = safe_db_query("SELECT slot FROM availability WHERE poll_id = ? AND user_id = ?", (poll_id, for_user), fetch=True)
-                pst[for_user] = set(r[0] for r in persisted)
+        # Die Auswahl lädt der Aufrufer vorher per load_user_selection oder gibt sie direkt mit –
+        # der Aufbau liest nicht auf dem Event-Loop
         day_rows = (len(DAYS) + 5 - 1) // 5
         for idx in range(len(DAYS)):
             btn = DaySelectButton(poll_id, idx, selected=(idx == day_index))
             btn.row = idx // 5
             self.add_item(btn)
         day = DAYS[day_index]
-        uid = for_user
-        user_temp = temp_selections.get(poll_id, {}).get(uid, set())
+        user_temp = selection if selection is not None else temp_selections.get((poll_id, for_user), set())
         for i, hour in enumerate(HOURS):
             btn = HourButton(poll_id, day, hour)
             btn.row = day_rows + (i // 5)
-            slot = f"{day}-{hour}"
-            selected = (slot in user_temp)
+            selected = (btn.slot in user_temp)
             if selected:
                 btn.style = discord.ButtonStyle.success
             else:
@@ -758,6 +1341,25 @@ class AvailabilityDayView(discord.ui.View):
         self.add_item(submit)
         self.add_item(remove)
 
+    def show_day(self, day_index: int, selection: Optional[Set[str]] = None):
+        """Anderen Tag anzeigen, ohne die Buttons neu zu erzeugen."""
+        self.day_index = day_index
+        user_temp = selection if selection is not None else temp_selections.get((self.poll_id, self.for_user), set())
+        for item in self.children:
+            if isinstance(item, DaySelectButton):
+                item.style = discord.ButtonStyle.success if item.day_index == day_index else discord.ButtonStyle.secondary
+            elif isinstance(item, HourButton):
+                item.set_day(DAYS[day_index])
+                item.style = discord.ButtonStyle.success if item.slot in user_temp else discord.ButtonStyle.secondary
+
+def availability_view_for(view: Optional[discord.ui.View], poll_id: str, user_id: int,
+                          selection: Set[str]) -> AvailabilityDayView:
+    """Die View des Nutzers mit der gespeicherten Auswahl neu einfärben; nur ohne passende View neu bauen."""
+    if isinstance(view, AvailabilityDayView) and view.for_user == user_id:
+        view.show_day(view.day_index, selection)
+        return view
+    return AvailabilityDayView(poll_id, day_index=getattr(view, "day_index", 0), for_user=user_id, selection=selection)
+
 class MonthSelectButton(discord.ui.Button):
     def __init__(self, poll_id: str, month_index: int, months: list):
         label = months[month_index]
@@ -773,7 +1375,7 @@ class MonthSelectButton(discord.ui.Button):
         embed = discord.Embed(
             title="🗓️ Quartals-Verfügbarkeit auswählen",
             description="Wähle Monate und Wochen des Quartals aus.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         try:
             await interaction.response.edit_message(embed=embed, view=new_view)
@@ -795,11 +1397,8 @@ class WeekSelectButton(discord.ui.Button):
         _, week_start, week_end = self.weeks[self.week_index]
         days = get_week_days(week_start, week_end)
         new_view = QuarterlyAvailabilityView(self.poll_id, selected_month=selected_month, months=months, weeks=weeks, selected_week=self.week_index, days=days)
-        uid = interaction.user.id
-        user_tmp = temp_selections.get(self.poll_id, {}).get(uid, set())
-        if not user_tmp:
-            persisted = safe_db_query("SELECT slot FROM availability WHERE poll_id = ? AND user_id = ?", (self.poll_id, uid), fetch=True)
-            user_tmp.update(r[0] for r in persisted if r)
+        # Geladene Auswahl bleibt in temp_selections, statt bei jedem Wochenwechsel neu gelesen zu werden
+        user_tmp = await load_user_selection(self.poll_id, interaction.user.id)
         for item in new_view.children:
             if isinstance(item, DayAvailButton):
                 if item.day in user_tmp:
@@ -809,7 +1408,7 @@ class WeekSelectButton(discord.ui.Button):
         embed = discord.Embed(
             title="🗓️ Quartals-Verfügbarkeit auswählen",
             description="Wähle Tage der Woche aus.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         try:
             await interaction.response.edit_message(embed=embed, view=new_view)
@@ -822,35 +1421,15 @@ class DayAvailButton(discord.ui.Button):
         self.poll_id = poll_id
         self.day = day
     async def callback(self, interaction: discord.Interaction):
-        uid = interaction.user.id
-        _tmp = temp_selections.setdefault(self.poll_id, {})
-        user_tmp = _tmp.setdefault(uid, set())
-        if not user_tmp:
-            persisted = safe_db_query("SELECT slot FROM availability WHERE poll_id = ? AND user_id = ?", (self.poll_id, uid), fetch=True)
-            user_tmp.update(r[0] for r in persisted if r)
+        user_tmp = await load_user_selection(self.poll_id, interaction.user.id)
         if self.day in user_tmp:
             user_tmp.remove(self.day)
         else:
             user_tmp.add(self.day)
-        months = self.view.months if hasattr(self.view, 'months') else []
-        selected_month = self.view.selected_month if hasattr(self.view, 'selected_month') else None
-        weeks = self.view.weeks if hasattr(self.view, 'weeks') else []
-        selected_week = self.view.selected_week if hasattr(self.view, 'selected_week') else None
-        days = self.view.days if hasattr(self.view, 'days') else []
-        new_view = QuarterlyAvailabilityView(self.poll_id, selected_month=selected_month, months=months, weeks=weeks, selected_week=selected_week, days=days)
-        for item in new_view.children:
-            if isinstance(item, DayAvailButton):
-                if item.day in user_tmp:
-                    item.style = discord.ButtonStyle.success
-                else:
-                    item.style = discord.ButtonStyle.secondary
-        embed = discord.Embed(
-            title="🗓️ Quartals-Verfügbarkeit auswählen",
-            description="Wähle Tage der Woche aus.",
-            color=discord.Color.green()
-        )
+        # Nur dieser Tag ändert sich: Button im bestehenden View umfärben statt den ganzen View neu zu bauen
+        self.style = discord.ButtonStyle.success if self.day in user_tmp else discord.ButtonStyle.secondary
         try:
-            await interaction.response.edit_message(embed=embed, view=new_view)
+            await interaction.response.edit_message(view=self.view)
         except Exception:
             pass
 
@@ -860,10 +1439,9 @@ class QuarterlySubmitButton(discord.ui.Button):
         self.poll_id = poll_id
     async def callback(self, interaction: discord.Interaction):
         uid = interaction.user.id
-        user_tmp = temp_selections.get(self.poll_id, {}).get(uid, set())
-        persist_availability(self.poll_id, uid, list(user_tmp))
-        if self.poll_id in temp_selections and uid in temp_selections[self.poll_id]:
-            temp_selections[self.poll_id].pop(uid, None)
+        user_tmp = temp_selections.get((self.poll_id, uid), set())
+        await db_write(persist_availability, self.poll_id, uid, list(user_tmp))
+        temp_selections.pop((self.poll_id, uid), None)
         try:
             await interaction.response.send_message("✅ Tage gespeichert!", ephemeral=True)
         except Exception:
@@ -902,22 +1480,23 @@ class QuarterlyAvailabilityView(discord.ui.View):
 
 class ShowMatchesButton(discord.ui.Button):
     def __init__(self, poll_id: str):
-        super().__init__(label="🤝 Matches anzeigen", style=discord.ButtonStyle.success)
+        super().__init__(label="🤝 Matches anzeigen", style=discord.ButtonStyle.success, custom_id=f"matches:{poll_id}")
         self.poll_id = poll_id
     async def callback(self, interaction: discord.Interaction):
         show_matches[self.poll_id] = not show_matches.get(self.poll_id, False)
-        embed = generate_poll_embed_from_db(self.poll_id, interaction.guild, show_matches_flag=show_matches.get(self.poll_id, False)) if "_quarterly" not in self.poll_id else generate_quarterly_poll_embed_from_db(self.poll_id, interaction.guild, show_matches_flag=show_matches.get(self.poll_id, False))
+        embed = await poll_embed_async(self.poll_id, interaction.guild)
         try:
             await interaction.response.edit_message(embed=embed)
         except Exception:
             log.exception("Failed to toggle matches")
 
 class PollView(discord.ui.View):
-    def __init__(self, poll_id: str):
+    def __init__(self, poll_id: str, options=None):
         super().__init__(timeout=None)
         self.poll_id = poll_id
 
-        options = get_options(poll_id)
+        if options is None:
+            options = get_options(poll_id)
         MAX_BUTTONS = 16
 
         for opt_id, opt_text, *_ in options[:MAX_BUTTONS]:
@@ -936,7 +1515,8 @@ class PollView(discord.ui.View):
             self.add_item(discord.ui.Button(
                 label=f"+{len(options)-MAX_BUTTONS} weitere Ideen",
                 style=discord.ButtonStyle.gray,
-                disabled=True
+                disabled=True,
+                custom_id=f"more:{poll_id}"
             ))
 
 class PollButton(discord.ui.Button):
@@ -946,21 +1526,15 @@ class PollButton(discord.ui.Button):
         self.option_id = option_id
     async def callback(self, interaction: discord.Interaction):
         uid = interaction.user.id
-        rows = safe_db_query("SELECT 1 FROM votes WHERE poll_id = ? AND option_id = ? AND user_id = ?", (self.poll_id, self.option_id, uid), fetch=True)
-        if rows:
-            remove_vote(self.poll_id, self.option_id, uid)
-        else:
-            add_vote(self.poll_id, self.option_id, uid)
-        embed = generate_poll_embed_from_db(self.poll_id, interaction.guild, show_matches_flag=show_matches.get(self.poll_id, False))
+        # Der Schreibzugriff liefert die Abstimmenden gleich mit – kein zweiter Lesezugriff fürs Feld
+        voters = await db_write(toggle_vote_voters, self.poll_id, self.option_id, uid)
+        embed = await vote_embed_async(self.poll_id, self.option_id, interaction.guild, quarterly=False, voters=voters)
+        remember_poll_message(self.poll_id, interaction.message)
+        # Eine Stimme ändert keine Buttons: die persistente View der Nachricht bleibt, nur das Embed wird ersetzt
         try:
-            new_view = PollView(self.poll_id)
-            bot.add_view(new_view)
-            await interaction.response.edit_message(embed=embed, view=new_view)
+            await interaction.response.edit_message(embed=embed)
         except Exception:
-            try:
-                await interaction.response.edit_message(embed=embed)
-            except Exception:
-                pass
+            pass
 
 class AddAvailabilityButton(discord.ui.Button):
     def __init__(self, poll_id: str):
@@ -968,11 +1542,12 @@ class AddAvailabilityButton(discord.ui.Button):
         self.poll_id = poll_id
     async def callback(self, interaction: discord.Interaction):
         try:
+            await load_user_selection(self.poll_id, interaction.user.id)
             view = AvailabilityDayView(self.poll_id, for_user=interaction.user.id)
             embed = discord.Embed(
                 title="🗓️ Verfügbarkeit auswählen",
                 description="Wähle Tage und Zeiten aus.",
-                color=discord.Color.green()
+                color=_COLOR_GREEN
             )
             await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
         except Exception:
@@ -993,32 +1568,15 @@ class DeleteOwnOptionButtonEphemeral(discord.ui.Button):
             except Exception:
                 pass
             return
-        safe_db_query("DELETE FROM options WHERE id = ?", (self.option_id,))
-        safe_db_query("DELETE FROM votes WHERE option_id = ?", (self.option_id,))
-        try:
-            if interaction.channel:
-                async for msg in interaction.channel.history(limit=200):
-                    if msg.author == bot.user and msg.embeds:
-                        em = msg.embeds[0]
-                        if "Worauf" in em.title or "Quartalsumfrage" in em.title:
-                            embed = generate_poll_embed_from_db(self.poll_id, interaction.guild, show_matches_flag=show_matches.get(self.poll_id, False)) if "Worauf" in em.title else generate_quarterly_poll_embed_from_db(self.poll_id, interaction.guild, show_matches_flag=show_matches.get(self.poll_id, False))
-                            try:
-                                bot.add_view(PollView(self.poll_id) if "Worauf" in em.title else QuarterlyPollView(self.poll_id))
-                            except Exception:
-                                pass
-                            await msg.edit(embed=embed, view=PollView(self.poll_id) if "Worauf" in em.title else QuarterlyPollView(self.poll_id))
-                            break
-        except Exception:
-            log.exception("Failed best-effort poll update on delete")
+        await asyncio.to_thread(delete_option, self.poll_id, self.option_id)
+        request_poll_refresh(self.poll_id, interaction.channel, interaction.guild)
 
 class EditOwnIdeasView(discord.ui.View):
-    def __init__(self, poll_id: str, user_id: int):
+    def __init__(self, poll_id: str, user_id: int, user_opts: list):
         super().__init__(timeout=None)
         self.poll_id = poll_id
         self.user_id = user_id
 
-        user_opts = get_user_options(poll_id, user_id)
-
         if not user_opts:
             self.add_item(discord.ui.Button(
                 label="Du hast noch keine eigenen Ideen.",
@@ -1048,35 +1606,31 @@ class OpenEditOwnIdeasButton(discord.ui.Button):
         self.poll_id = poll_id
     async def callback(self, interaction: discord.Interaction):
         user_id = interaction.user.id
-        user_opts = get_user_options(self.poll_id, user_id)
+        user_opts = await asyncio.to_thread(get_user_options, self.poll_id, user_id)
         if not user_opts:
             try:
                 await interaction.response.send_message("ℹ️ Du hast noch keine eigenen Ideen in dieser Umfrage.", ephemeral=True)
             except Exception:
                 pass
             return
-        view = EditOwnIdeasView(self.poll_id, user_id)
+        view = EditOwnIdeasView(self.poll_id, user_id, user_opts)
         try:
             await interaction.response.send_message("⚙️ Deine eigenen Ideen (nur für dich sichtbar):", view=view, ephemeral=True)
         except Exception:
             pass
 
 class MatchSelect(discord.ui.Select):
-    def __init__(self, poll_id: str, matches: dict):
+    def __init__(self, poll_id: str, matches: dict, guild: Optional[discord.Guild] = None):
         options = []
         self.poll_id = poll_id
         self.matches = matches
+        names = display_names(guild, (u for infos in matches.values() for info in infos for u in info["users"]))
         for option_text, infos in matches.items():
             for info in infos:
                 slot = info["slot"]
                 users = info["users"]
-                if "-" in slot:
-                    day, hour_s = slot.split("-")
-                    hour = int(hour_s)
-                    time_str = slot_label_range(day, hour)
-                else:
-                    time_str = slot
-                user_names = " ".join([user_display_name(None, u) for u in users])
+                time_str = format_slot_range(slot)
+                user_names = " ".join(names[u] for u in users)
                 label = f"{option_text[:50]} | {time_str} | {user_names[:50]}"
                 value = f"{option_text}|{slot}"
                 options.append(discord.SelectOption(label=label, value=value))
@@ -1091,9 +1645,9 @@ class MatchSelect(discord.ui.Select):
         if not selected:
             return
         option_text, slot = selected.split("|", 1)
-        if "-" in slot:
-            day, hour_s = slot.split("-")
-            hour = int(hour_s)
+        parts = SLOT_PARTS.get(slot)
+        if parts is not None:
+            day, hour = parts
             date_next = next_date_for_day_short(day)
             start_dt = datetime.combine(date_next, _time(hour, 0))
             end_dt = start_dt + timedelta(hours=1)
@@ -1104,7 +1658,7 @@ class MatchSelect(discord.ui.Select):
             parts = slot.split(". ")
             if len(parts) > 1:
                 datum_str = parts[1]  # e.g. "01.10."
-                year = datetime.now().year
+                year = datetime.now(_TZ).year
                 full_datum = f"{datum_str}{year}"  # e.g. "01.10.2025"
                 date_str = f"{full_datum} - {full_datum}"
             else:
@@ -1128,9 +1682,9 @@ class NewEventButton(discord.ui.Button):
             log.exception("Failed to send CreateEventModal")
 
 class SelectMatchView(discord.ui.View):
-    def __init__(self, poll_id: str, matches: dict):
+    def __init__(self, poll_id: str, matches: dict, guild: Optional[discord.Guild] = None):
         super().__init__(timeout=None)
-        select = MatchSelect(poll_id, matches)
+        select = MatchSelect(poll_id, matches, guild)
         self.add_item(select)
         new_btn = NewEventButton(poll_id)
         self.add_item(new_btn)
@@ -1178,15 +1732,21 @@ class CreateEventModal(discord.ui.Modal, title="Event erstellen"):
                     log.exception("Failed to send parsing error")
                 return
 
-            tz = ZoneInfo(POST_TIMEZONE)
-            start_dt = datetime(start_date.year, start_date.month, start_date.day, start_time.hour, start_time.minute, tzinfo=tz)
-            end_dt = datetime(end_date.year, end_date.month, end_date.day, end_time.hour, end_time.minute, tzinfo=tz)
+            start_dt = datetime(start_date.year, start_date.month, start_date.day, start_time.hour, start_time.minute, tzinfo=_TZ)
+            end_dt = datetime(end_date.year, end_date.month, end_date.day, end_time.hour, end_time.minute, tzinfo=_TZ)
 
-            event_id = datetime.now(tz=ZoneInfo(POST_TIMEZONE)).strftime("%Y%m%dT%H%M%S") + "-" + str(interaction.user.id)
-            created_at = datetime.now(timezone.utc).isoformat()
+            now = datetime.now(_TZ)
+            event_id = now.strftime(_ID_TIME_FMT) + "-" + str(interaction.user.id)
+            created_at = now.astimezone(timezone.utc).isoformat()
             try:
-                safe_db_query("INSERT INTO created_events(id, poll_id, title, description, start_time, end_time, participants, location, posted_channel_id, posted_message_id, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                           (event_id, self.poll_id, title, description, start_dt.isoformat(), end_dt.isoformat(), "", location, None, None, created_at))
+                start_epoch = int(start_dt.timestamp())
+                # Event und Anmeldung des Erstellers in einer Transaktion
+                await asyncio.to_thread(safe_db_transaction, [
+                    (SQL_INSERT_CREATED_EVENT,
+                     (event_id, self.poll_id, title, description, start_dt.isoformat(), end_dt.isoformat(), "", location, None, None, created_at, start_epoch)),
+                    (SQL_INSERT_RSVP, (event_id, interaction.user.id)),
+                ])
+                _created_events[event_id] = [title, description, start_dt.isoformat(), end_dt.isoformat(), "", location, None, None, start_epoch]
             except Exception:
                 log.exception("Failed inserting created_event")
                 try:
@@ -1195,12 +1755,6 @@ class CreateEventModal(discord.ui.Modal, title="Event erstellen"):
                     pass
                 return
 
-            try:
-                creator_uid = interaction.user.id
-                safe_db_query("INSERT OR IGNORE INTO created_event_rsvps(event_id, user_id) VALUES (?, ?)", (event_id, creator_uid))
-            except Exception:
-                log.exception("Failed adding creator to RSVPs")
-
             target_channel = None
             if CREATED_EVENTS_CHANNEL_ID:
                 target_channel = bot.get_channel(CREATED_EVENTS_CHANNEL_ID)
@@ -1215,36 +1769,9 @@ class CreateEventModal(discord.ui.Modal, title="Event erstellen"):
                     pass
                 return
 
-            embed = discord.Embed(
-                title=title,
-                description=description if description else None,
-                color=discord.Color.blue()
-            )
-            embed.set_thumbnail(url=interaction.guild.icon.url if interaction.guild and interaction.guild.icon else None)
-
-            start_str = start_dt.strftime("%d.%m.%y %H:%M")
-            end_str = end_dt.strftime("%d.%m.%y %H:%M")
-            if start_date == end_date:
-                weekday = start_dt.strftime("%A")
-                de_weekday = weekday_names.get(weekday, weekday)
-                date_part = start_dt.strftime("%d.%m.%y")
-                time_part_start = start_dt.strftime("%H:%M")
-                time_part_end = end_dt.strftime("%H:%M")
-                wann_value = f"{de_weekday}, {date_part} {time_part_start} – {time_part_end} Uhr"
-            else:
-                wann_value = f"{start_str} – {end_str}"
-            embed.add_field(name="Wann", value=wann_value, inline=False)
-
-            if location:
-                embed.add_field(name="Ort", value=location, inline=False)
-
-            rows2 = safe_db_query("SELECT user_id FROM created_event_rsvps WHERE event_id = ?", (event_id,), fetch=True) or []
-            user_ids = [r[0] for r in rows2]
-            if user_ids:
-                names = [user_display_name(interaction.guild, uid) for uid in user_ids]
-                embed.add_field(name="✅ Interessiert", value=", ".join(names[:10]) + (f" und {len(names)-10} weitere..." if len(names)>10 else ""), inline=False)
-            else:
-                embed.add_field(name="✅ Interessiert", value="Noch niemand", inline=False)
+            # Die RSVP-Liste ist gerade erst mit dem Ersteller angelegt worden – kein SELECT nötig
+            rsvp_csv = str(interaction.user.id)
+            embed = await build_created_event_embed(event_id, interaction.guild, bundle=(*_created_events[event_id], rsvp_csv))
 
             view = EventSignupView(event_id, interaction.user.id)
             try:
@@ -1253,7 +1780,9 @@ class CreateEventModal(discord.ui.Modal, title="Event erstellen"):
                 pass
             try:
                 sent = await target_channel.send(embed=embed, view=view)
-                safe_db_query("UPDATE created_events SET posted_channel_id = ?, posted_message_id = ? WHERE id = ?", (target_channel.id, sent.id, event_id))
+                _rsvp_last_sent[sent.id] = rsvp_csv
+                await db_query_async(SQL_SET_EVENT_POSTED, (target_channel.id, sent.id, event_id))
+                cache_created_event_posted(event_id, target_channel.id, sent.id)
             except Exception:
                 log.exception("Failed posting created event to channel")
                 try:
@@ -1262,7 +1791,7 @@ class CreateEventModal(discord.ui.Modal, title="Event erstellen"):
                     pass
                 return
             if start_dt:
-                schedule_reminders_for_created_event(event_id, start_dt, target_channel.id)
+                await schedule_reminders_for_created_event(event_id, start_dt, target_channel.id)
         except Exception:
             log.exception("Unhandled error in CreateEventModal.on_submit")
             try:
@@ -1275,13 +1804,13 @@ class CreateEventButton(discord.ui.Button):
         super().__init__(label="📅 Event erstellen", style=discord.ButtonStyle.success, custom_id=f"createevent:{poll_id}")
         self.poll_id = poll_id
     async def callback(self, interaction: discord.Interaction):
-        matches = compute_matches_for_poll_from_db(self.poll_id)
+        matches = await asyncio.to_thread(compute_matches_for_poll_from_db, self.poll_id)
         if matches:
-            view = SelectMatchView(self.poll_id, matches)
+            view = SelectMatchView(self.poll_id, matches, interaction.guild)
             embed = discord.Embed(
                 title="🎯 Event aus Match erstellen",
                 description="Wähle ein bestehendes Match aus, um ein Event vorzubefüllt zu erstellen.",
-                color=discord.Color.blue()
+                color=_COLOR_BLUE
             )
             try:
                 await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
@@ -1295,11 +1824,12 @@ class CreateEventButton(discord.ui.Button):
                 log.exception("Failed to send CreateEventModal")
 
 class QuarterlyPollView(discord.ui.View):
-    def __init__(self, poll_id: str):
+    def __init__(self, poll_id: str, options=None):
         super().__init__(timeout=None)
         self.poll_id = poll_id
 
-        options = get_options(poll_id)
+        if options is None:
+            options = get_options(poll_id)
         MAX_BUTTONS = 16   # Sicherheitsabstand zu den 25
 
         # Option Buttons
@@ -1320,7 +1850,8 @@ class QuarterlyPollView(discord.ui.View):
             self.add_item(discord.ui.Button(
                 label=f"+{len(options)-MAX_BUTTONS} weitere Ideen",
                 style=discord.ButtonStyle.gray,
-                disabled=True
+                disabled=True,
+                custom_id=f"more:{poll_id}"
             ))
 
 class QuarterlyPollButton(discord.ui.Button):
@@ -1330,28 +1861,21 @@ class QuarterlyPollButton(discord.ui.Button):
         self.option_id = option_id
     async def callback(self, interaction: discord.Interaction):
         uid = interaction.user.id
-        rows = safe_db_query("SELECT 1 FROM votes WHERE poll_id = ? AND option_id = ? AND user_id = ?", (self.poll_id, self.option_id, uid), fetch=True)
-        if rows:
-            remove_vote(self.poll_id, self.option_id, uid)
-        else:
-            add_vote(self.poll_id, self.option_id, uid)
-        embed = generate_quarterly_poll_embed_from_db(self.poll_id, interaction.guild, show_matches_flag=show_matches.get(self.poll_id, False))
+        # Der Schreibzugriff liefert die Abstimmenden gleich mit – kein zweiter Lesezugriff fürs Feld
+        voters = await db_write(toggle_vote_voters, self.poll_id, self.option_id, uid)
+        embed = await vote_embed_async(self.poll_id, self.option_id, interaction.guild, quarterly=True, voters=voters)
+        remember_poll_message(self.poll_id, interaction.message)
         try:
-            new_view = QuarterlyPollView(self.poll_id)
-            bot.add_view(new_view)
-            await interaction.response.edit_message(embed=embed, view=new_view)
+            await interaction.response.edit_message(embed=embed)
         except Exception:
-            try:
-                await interaction.response.edit_message(embed=embed)
-            except Exception:
-                pass
+            pass
 
 class QuarterlyAddAvailabilityButton(discord.ui.Button):
     def __init__(self, poll_id: str):
         super().__init__(label="🗓️ Verfügbarkeit hinzufügen", style=discord.ButtonStyle.success, custom_id=f"qavail:{poll_id}")
         self.poll_id = poll_id
     async def callback(self, interaction: discord.Interaction):
-        now = datetime.now(ZoneInfo(POST_TIMEZONE))
+        now = datetime.now(_TZ)
         quarter_start = get_current_quarter_start()
         if now.month in [3, 6, 9, 12]:
             quarter_start = get_next_quarter_start(quarter_start)
@@ -1361,48 +1885,128 @@ class QuarterlyAddAvailabilityButton(discord.ui.Button):
             embed = discord.Embed(
                 title="🗓️ Quartals-Verfügbarkeit auswählen",
                 description="Wähle Monate des Quartals aus.",
-                color=discord.Color.green()
+                color=_COLOR_GREEN
             )
             await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
         except Exception:
             log.exception("Failed opening QuarterlyAvailabilityView")
 
-async def build_created_event_embed(event_id: str, guild: Optional[discord.Guild] = None) -> discord.Embed:
-    rows = safe_db_query("SELECT title, description, start_time, end_time, participants, location FROM created_events WHERE id = ?", (event_id,), fetch=True) or []
-    if not rows:
+# In-Memory-Kopie von created_events (ohne RSVPs); die DB wird write-through mitgeschrieben.
+# Spalten wie in SQL_SELECT_CREATED_EVENTS ohne die id.
+_created_events: Dict[str, list] = {}
+_EV_POSTED_CHANNEL, _EV_POSTED_MESSAGE, _EV_START_EPOCH = 6, 7, 8
+
+def fill_created_events_cache(rows):
+    _created_events.clear()
+    for event_id, *fields in rows:
+        _created_events[event_id] = fields
+
+def read_startup_rows():
+    """Events, letzte Umfragen mit Optionen und Nachrichten in einer Lesetransaktion statt einzelner impliziter."""
+    con = get_db_connection()
+    with _db_lock:
+        con.execute("BEGIN")
+        try:
+            events = con.execute(SQL_SELECT_CREATED_EVENTS).fetchall()
+            polls = con.execute(SQL_SELECT_RECENT_POLL_IDS).fetchall()
+            options = con.execute(SQL_SELECT_RECENT_POLL_OPTIONS).fetchall()
+            messages = con.execute(SQL_SELECT_RECENT_POLL_MESSAGES).fetchall()
+        finally:
+            con.execute("COMMIT")
+    return events, polls, options, messages
+
+def cache_created_event_posted(event_id: str, channel_id: Optional[int], message_id: Optional[int]):
+    row = _created_events.get(event_id)
+    if row is not None:
+        row[_EV_POSTED_CHANNEL] = channel_id
+        row[_EV_POSTED_MESSAGE] = message_id
+
+def parse_id_csv(csv: Optional[str]) -> List[int]:
+    """Zerlegt eine GROUP_CONCAT-Liste von User-IDs."""
+    return [int(uid) for uid in csv.split(",")] if csv else []
+
+def toggle_created_event_rsvp(event_id: str, user_id: int) -> bool:
+    """Schaltet die Anmeldung um; True, wenn der User jetzt angemeldet ist.
+
+    Der INSERT OR IGNORE zeigt über rowcount, ob schon eine Anmeldung da war; nur dann wird gelöscht.
+    """
+    con = get_db_connection()
+    with _db_lock:
+        if con.execute(SQL_INSERT_RSVP, (event_id, user_id)).rowcount == 0:
+            con.execute(SQL_DELETE_RSVP, (event_id, user_id))
+            return False
+    return True
+
+async def get_created_event_bundle(event_id: str):
+    """Event-Felder plus RSVP-Liste (kommagetrennt, in Anmeldereihenfolge)."""
+    row = _created_events.get(event_id)
+    if row is None:
+        rows = await db_query_async(SQL_SELECT_CREATED_EVENT_BUNDLE, (event_id,), fetch=True)
+        if not rows:
+            return None
+        _created_events[event_id] = list(rows[0][:9])
+        return rows[0]
+    rsvp = await db_query_async(SQL_SELECT_RSVP_CSV, (event_id,), fetch=True)
+    return (*row, rsvp[0][0] if rsvp else None)
+
+_created_event_embeds: Dict[str, dict] = {}
+MAX_EVENT_EMBEDS = 256
+_rsvp_fields: Dict[Tuple[str, Optional[str]], dict] = {}
+MAX_RSVP_FIELDS = 128
+
+async def build_created_event_embed(event_id: str, guild: Optional[discord.Guild] = None, bundle=None) -> discord.Embed:
+    if bundle is None:
+        bundle = await get_created_event_bundle(event_id)
+    if not bundle:
         return discord.Embed(title="Event", description="(Details fehlen)", color=discord.Color.dark_grey())
-    title, description, start_iso, end_iso, participants_text, location = rows[0]
+    base = _created_event_embeds.get(event_id)
+    if base is None:
+        base = _build_created_event_base_embed(bundle, guild).to_dict()
+        # Älteste Einträge zuerst verwerfen; vergangene Events werden praktisch nicht mehr geklickt
+        if len(_created_event_embeds) >= MAX_EVENT_EMBEDS:
+            _created_event_embeds.pop(next(iter(_created_event_embeds)))
+        _created_event_embeds[event_id] = base
+    # Eigene Feldliste, damit Titeländerungen (z. B. Erinnerung) den Cache nicht verändern;
+    # Embed.copy() würde die Feldliste teilen
+    fields = list(base.get("fields", []))
+    fields.append(_rsvp_field(event_id, bundle[-1], guild))
+    return discord.Embed.from_dict({**base, "fields": fields})
+
+def _rsvp_field(event_id: str, rsvp_csv: Optional[str], guild: Optional[discord.Guild]) -> dict:
+    """Das "Interessiert"-Feld hängt nur von der RSVP-Liste ab; wiederholte Klicks treffen den Cache."""
+    key = (event_id, rsvp_csv)
+    field = _rsvp_fields.get(key)
+    if field is None:
+        if len(_rsvp_fields) >= MAX_RSVP_FIELDS:
+            _rsvp_fields.pop(next(iter(_rsvp_fields)))
+        user_ids = parse_id_csv(rsvp_csv)
+        if user_ids:
+            names = [user_display_name(guild, uid) for uid in user_ids]
+            value = ", ".join(names[:20]) + (f", und {len(names)-20} weitere..." if len(names)>20 else "")
+        else:
+            value = "Keine"
+        field = {"name": "✅ Interessiert", "value": value, "inline": False}
+        _rsvp_fields[key] = field
+    return field
+
+def _build_created_event_base_embed(bundle, guild: Optional[discord.Guild]) -> discord.Embed:
+    """Titel, Beschreibung, Wann und Ort – alles, was sich nach dem Anlegen nicht mehr ändert."""
+    title, description, start_iso, end_iso, participants_text, location, _ch_id, _msg_id, start_epoch, _rsvp_csv = bundle
     embed = discord.Embed(
         title=title,
         description=description if description else None,
-        color=discord.Color.blue()
+        color=_COLOR_BLUE
     )
     embed.set_thumbnail(url=guild.icon.url if guild and guild.icon else None)
-    if start_iso:
+    if start_epoch is not None:
         try:
-            start_dt = datetime.fromisoformat(start_iso)
+            start_dt = datetime.fromtimestamp(start_epoch, _TZ)
             end_dt = datetime.fromisoformat(end_iso) if end_iso else None
-            if end_dt and start_dt.date() == end_dt.date():
-                weekday = start_dt.strftime("%A")
-                de_weekday = weekday_names.get(weekday, weekday)
-                date_part = start_dt.strftime("%d.%m.%y")
-                time_part_start = start_dt.strftime("%H:%M")
-                time_part_end = end_dt.strftime("%H:%M")
-                wann_value = f"{de_weekday}, {date_part} {time_part_start} – {time_part_end} Uhr"
-            else:
-                wann_value = f"{start_str} – {end_str}"
-            embed.add_field(name="Wann", value=wann_value, inline=False)
+            embed.add_field(name="Wann", value=format_event_when(start_dt, end_dt), inline=False)
         except Exception:
             embed.add_field(name="Wann", value=start_iso, inline=False)
     if location:
         embed.add_field(name="Ort", value=location, inline=False)
-    rows2 = safe_db_query("SELECT user_id FROM created_event_rsvps WHERE event_id = ?", (event_id,), fetch=True) or []
-    user_ids = [r[0] for r in rows2]
-    if user_ids:
-        names = [user_display_name(guild, uid) for uid in user_ids]
-        embed.add_field(name="✅ Interessiert", value=", ".join(names[:20]) + (f", und {len(names)-20} weitere..." if len(names)>20 else ""), inline=False)
-    else:
-        embed.add_field(name="✅ Interessiert", value="Keine", inline=False)
     return embed
 
 class EventSignupView(discord.ui.View):
@@ -1418,55 +2022,133 @@ class EventSignupView(discord.ui.View):
         await interaction.response.defer()
         uid = interaction.user.id
         try:
-            existing = safe_db_query("SELECT 1 FROM created_event_rsvps WHERE event_id = ? AND user_id = ?", (self.event_id, uid), fetch=True)
-            if existing:
-                safe_db_query("DELETE FROM created_event_rsvps WHERE event_id = ? AND user_id = ?", (self.event_id, uid))
-            else:
-                safe_db_query("INSERT OR IGNORE INTO created_event_rsvps(event_id, user_id) VALUES (?, ?)", (self.event_id, uid))
-        except Exception:
+            await db_write(toggle_created_event_rsvp, self.event_id, uid)
+        except sqlite3.Error:
             log.exception("Error toggling RSVP")
-        try:
-            embed = await build_created_event_embed(self.event_id, interaction.guild)
-            await interaction.message.edit(embed=embed)
-            log.info(f"Successfully edited event message for event {self.event_id} - bot has permissions to edit message")
-        except discord.Forbidden:
-            log.error(f"Bot lacks permissions to edit event message for event {self.event_id} - permissions missing")
-        except Exception as e:
-            log.exception(f"Failed to edit event message for event {self.event_id}: {e}")
-
-scheduler = AsyncIOScheduler(timezone=ZoneInfo(POST_TIMEZONE))
+        request_created_event_refresh(self.event_id, interaction.message, interaction.guild)
+
+RSVP_REFRESH_DELAY = 0.5
+_rsvp_refresh_tasks: Dict[str, asyncio.Task] = {}
+_rsvp_refresh_dirty: Set[str] = set()
+# message_id → RSVP-Liste, mit der die Nachricht zuletzt bearbeitet wurde
+_rsvp_last_sent: Dict[int, Optional[str]] = {}
+
+def request_created_event_refresh(event_id: str, message: discord.Message, guild: Optional[discord.Guild]):
+    """Fasst Klick-Salven zusammen: pro Event läuft höchstens ein Refresh, weitere Klicks markieren ihn nur als veraltet."""
+    if event_id in _rsvp_refresh_tasks:
+        _rsvp_refresh_dirty.add(event_id)
+        return
+    _rsvp_refresh_tasks[event_id] = spawn_background(
+        _refresh_created_event_message(event_id, message, guild), name=f"RSVP refresh for created event {event_id}")
 
-def _remove_created_event_jobs(event_id: str):
+async def _refresh_created_event_message(event_id: str, message: discord.Message, guild: Optional[discord.Guild]):
     try:
-        scheduler.remove_job(f"created_event_reminder_24_{event_id}")
-    except Exception:
-        pass
-    try:
-        scheduler.remove_job(f"created_event_reminder_1_{event_id}")
-    except Exception:
-        pass
-
-def schedule_reminders_for_created_event(event_id: str, start_dt: datetime, channel_id: int):
-    _remove_created_event_jobs(event_id)
+        while True:
+            await asyncio.sleep(RSVP_REFRESH_DELAY)
+            _rsvp_refresh_dirty.discard(event_id)
+            bundle = await get_created_event_bundle(event_id)
+            rsvp_csv = bundle[-1] if bundle else None
+            # An- und gleich wieder Abmelden ergibt dieselbe Liste wie beim letzten Edit: kein PATCH nötig
+            if bundle and message.id in _rsvp_last_sent and _rsvp_last_sent[message.id] == rsvp_csv:
+                if event_id not in _rsvp_refresh_dirty:
+                    break
+                continue
+            embed = await build_created_event_embed(event_id, guild, bundle=bundle)
+            try:
+                await message.edit(embed=embed)
+                _rsvp_last_sent[message.id] = rsvp_csv
+                log.info(f"Successfully edited event message for event {event_id} - bot has permissions to edit message")
+            except discord.Forbidden:
+                log.error(f"Bot lacks permissions to edit event message for event {event_id} - permissions missing")
+            except discord.HTTPException as e:
+                log.warning(f"Failed to edit event message for event {event_id}: {e}")
+            # Während Build/Edit eingetroffene Klicks brauchen noch einen Durchlauf
+            if event_id not in _rsvp_refresh_dirty:
+                break
+    finally:
+        _rsvp_refresh_tasks.pop(event_id, None)
+
+# Erinnerungen für erstellte Events liegen in der DB (siehe created_event_reminder_loop);
+# hier bleiben nur die festen Cron-Jobs. Verspätete Läufe werden einmal nachgeholt statt mehrfach.
+scheduler = AsyncIOScheduler(timezone=_TZ, job_defaults={"coalesce": True, "misfire_grace_time": 3600})
+
+REMINDER_HOURS = (24, 1)
+REMINDER_MAX_SLEEP = 300
+REMINDER_BATCH = 32
+# Mehr parallele Sends pro Kanal bringen wegen Discords Rate-Limit nichts
+REMINDER_CONCURRENCY = 8
+_reminder_wakeup = asyncio.Event()
+_reminder_send_limit = asyncio.Semaphore(REMINDER_CONCURRENCY)
+_reminder_task: Optional[asyncio.Task] = None
+
+async def schedule_reminders_for_created_event(event_id: str, start_dt: datetime, channel_id: int):
+    """Merkt die erste Erinnerung in der DB vor; der Dispatcher übernimmt den Rest."""
     if not start_dt:
         return
     if start_dt.tzinfo is None:
-        start_dt = start_dt.replace(tzinfo=ZoneInfo(POST_TIMEZONE))
-    t24 = start_dt - timedelta(hours=24)
-    t1 = start_dt - timedelta(hours=1)
-    now = datetime.now(timezone.utc)
-    if t24 > now:
-        scheduler.add_job(lambda: bot.loop.create_task(_created_event_reminder_coro(event_id, channel_id, 24)),
-                          trigger=DateTrigger(run_date=t24), id=f"created_event_reminder_24_{event_id}", replace_existing=True)
-        log.info("Scheduled created-event 24h reminder for %s at %s", event_id, t24.isoformat())
-    elif t24 <= now < start_dt:
-        bot.loop.create_task(_created_event_reminder_coro(event_id, channel_id, 24))
-    if t1 > now:
-        scheduler.add_job(lambda: bot.loop.create_task(_created_event_reminder_coro(event_id, channel_id, 1)),
-                          trigger=DateTrigger(run_date=t1), id=f"created_event_reminder_1_{event_id}", replace_existing=True)
-        log.info("Scheduled created-event 1h reminder for %s at %s", event_id, t1.isoformat())
-    elif t1 <= now < start_dt:
-        bot.loop.create_task(_created_event_reminder_coro(event_id, channel_id, 1))
+        start_dt = start_dt.replace(tzinfo=_TZ)
+    first = REMINDER_HOURS[0]
+    next_at = int((start_dt - timedelta(hours=first)).timestamp())
+    await db_query_async(SQL_SET_FIRST_REMINDER, (next_at, first, channel_id, event_id))
+    log.info("Scheduled created-event %dh reminder for %s at %s", first, event_id, datetime.fromtimestamp(next_at, _TZ).isoformat())
+    _reminder_wakeup.set()
+
+async def _send_created_event_reminder(event_id: str, channel_id: int, hours_before: int):
+    async with _reminder_send_limit:
+        await _created_event_reminder_coro(event_id, channel_id, hours_before)
+
+async def _send_created_event_reminders(batch: List[Tuple[str, int, int]]):
+    results = await asyncio.gather(*(_send_created_event_reminder(*item) for item in batch), return_exceptions=True)
+    for (event_id, _ch, _h), res in zip(batch, results):
+        if isinstance(res, BaseException):
+            log.error("Reminder for created event %s failed", event_id, exc_info=res)
+
+async def _dispatch_created_event_reminders(due):
+    """Fällige Zeilen (id, next_at, hours, channel_id, start_epoch) auf die nächste Stufe setzen und senden."""
+    # Zuerst die nächste Stufe vormerken, damit ein Fehler beim Senden keine Endlosschleife erzeugt
+    advance = []
+    batch = []
+    now = time.time()
+    for event_id, _next_at, hours_before, channel_id, start_ts in due:
+        later = [h for h in REMINDER_HOURS if h < hours_before]
+        if start_ts is not None and later:
+            advance.append((int(start_ts - later[0] * 3600), later[0], event_id))
+        else:
+            advance.append((None, None, event_id))
+        if start_ts is not None and now < start_ts:
+            batch.append((event_id, channel_id, hours_before))
+    await db_query_async(SQL_ADVANCE_REMINDER, advance, many=True)
+    if batch:
+        # Senden im eigenen Task, damit ein langsamer Discord-Call die nächste Erinnerung nicht aufhält
+        spawn_background(_send_created_event_reminders(batch), name=f"Created-event reminders ({len(batch)})")
+
+async def created_event_reminder_loop():
+    """Ein einziger Task, der bis zur nächsten fälligen Erinnerung schläft und sie dann auslöst."""
+    await bot.wait_until_ready()
+    while not bot.is_closed():
+        _reminder_wakeup.clear()
+        timeout = REMINDER_MAX_SLEEP
+        try:
+            rows = await db_query_async(SQL_SELECT_UPCOMING_REMINDERS, (REMINDER_BATCH,), fetch=True)
+            now = time.time()
+            due = [row for row in rows if row[1] <= now]
+            if due:
+                await _dispatch_created_event_reminders(due)
+                continue
+        except sqlite3.Error:
+            rows = []
+            log.exception("DB error fetching next created-event reminder")
+        except Exception:
+            # Eine fehlerhafte Zeile oder ein gescheiterter Versand darf den einzigen Dispatcher nicht beenden;
+            # ohne rows wartet die nächste Runde REMINDER_MAX_SLEEP statt sofort erneut zu scheitern
+            rows = []
+            log.exception("Created-event reminder pass failed")
+        if rows:
+            timeout = min(max(rows[0][1] - time.time(), 0), timeout)
+        try:
+            await asyncio.wait_for(_reminder_wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
 
 async def _created_event_reminder_coro(event_id: str, channel_id: int, hours_before: int):
     ch = bot.get_channel(channel_id)
@@ -1474,113 +2156,90 @@ async def _created_event_reminder_coro(event_id: str, channel_id: int, hours_bef
         log.info("Reminder: channel %s not found for event %s", channel_id, event_id)
         return
     guild = ch.guild if hasattr(ch, 'guild') else None
-    start_iso = None
+    start_epoch = None
     try:
-        rows = safe_db_query("SELECT posted_channel_id, posted_message_id, start_time FROM created_events WHERE id = ?", (event_id,), fetch=True) or []
-    except Exception:
-        rows = []
+        bundle = await get_created_event_bundle(event_id)
+    except sqlite3.Error:
+        bundle = None
         log.exception("DB error fetching created_events for reminder")
-    if rows:
-        old_ch_id, old_msg_id, start_iso = rows[0]
+    if bundle:
+        old_ch_id, old_msg_id, start_epoch = bundle[_EV_POSTED_CHANNEL], bundle[_EV_POSTED_MESSAGE], bundle[_EV_START_EPOCH]
         if old_ch_id and old_msg_id:
+            # Die gespeicherten IDs gelten als Wahrheit; erst ein NotFound räumt sie auf
             try:
-                old_ch = bot.get_channel(old_ch_id)
-                if old_ch:
-                    try:
-                        old_msg = await old_ch.fetch_message(old_msg_id)
-                        try:
-                            await old_msg.delete()
-                        except discord.NotFound:
-                            pass
-                        except Exception:
-                            log.exception("Failed deleting old created event message during reminder")
-                    except discord.NotFound:
-                        try:
-                            safe_db_query("UPDATE created_events SET posted_channel_id = NULL, posted_message_id = NULL WHERE id = ?", (event_id,))
-                        except Exception:
-                            log.exception("Failed clearing posted refs during reminder")
-                    except Exception:
-                        log.exception("Error fetching old created event message during reminder")
-            except Exception:
-                log.exception("Failed while handling old created event message during reminder")
+                await bot.get_partial_messageable(old_ch_id).get_partial_message(old_msg_id).delete()
+            except discord.NotFound:
+                try:
+                    await db_query_async(SQL_CLEAR_EVENT_POSTED, (event_id,))
+                    cache_created_event_posted(event_id, None, None)
+                except sqlite3.Error:
+                    log.exception("Failed clearing posted refs during reminder")
+            except discord.HTTPException as e:
+                log.warning("Failed deleting old created event message during reminder: %s", e)
     try:
-        embed = await build_created_event_embed(event_id, guild)
-    except Exception:
+        embed = await build_created_event_embed(event_id, guild, bundle=bundle)
+    except sqlite3.Error:
         log.exception("Failed building created event embed")
         embed = discord.Embed(title="📣 Event", description="Details", color=discord.Color.orange())
-    if start_iso:
-        try:
-            sdt = datetime.fromisoformat(start_iso)
-            now_local = datetime.now(sdt.tzinfo or timezone.utc)
-            delta = sdt - now_local
-            hours_left = int(delta.total_seconds() // 3600)
-            new_title = embed.title or "Event"
-            embed.title = f"📣 startet in ~{hours_left}h — {new_title}"
-        except Exception:
-            pass
+    if start_epoch is not None:
+        hours_left = int((start_epoch - time.time()) // 3600)
+        new_title = embed.title or "Event"
+        embed.title = f"📣 startet in ~{hours_left}h — {new_title}"
     view = EventSignupView(event_id)
-    try:
-        bot.add_view(view)
-    except Exception:
-        pass
+    bot.add_view(view)
     try:
         sent = await ch.send(embed=embed, view=view)
-        try:
-            safe_db_query("UPDATE created_events SET posted_channel_id = ?, posted_message_id = ? WHERE id = ?", (ch.id, sent.id, event_id))
-        except Exception:
-            log.exception("Failed to persist created event posted ids during reminder")
-    except Exception:
-        log.exception("Failed to send reminder for created event %s", event_id)
-
-async def post_poll_to_channel(channel: discord.abc.Messageable, delete_old: bool = True):
-    if delete_old:
-        # Delete old poll messages before posting new one
-        async for msg in channel.history(limit=10):
-            if msg.author == bot.user and msg.embeds:
-                embed = msg.embeds[0]
-                if "Worauf hast du diese Woche Lust?" in embed.title or "Quartalsumfrage" in embed.title or "Tages-Update" in embed.title or "Wöchentliches Update" in embed.title:
-                    try:
-                        await msg.delete()
-                        log.info(f"Deleted old poll/summary message {msg.id}")
-                    except Exception:
-                        log.exception(f"Failed to delete old poll/summary message {msg.id}")
-
-    poll_id = datetime.now(tz=ZoneInfo(POST_TIMEZONE)).strftime("%Y%m%dT%H%M%S")
-    create_poll_record(poll_id)
-    embed = generate_poll_embed_from_db(poll_id, channel.guild if isinstance(channel, discord.TextChannel) else None, show_matches_flag=show_matches.get(poll_id, False))
-    view = PollView(poll_id)
+    except discord.HTTPException as e:
+        log.warning("Failed to send reminder for created event %s: %s", event_id, e)
+        return
+    try:
+        await db_query_async(SQL_SET_EVENT_POSTED, (ch.id, sent.id, event_id))
+        cache_created_event_posted(event_id, ch.id, sent.id)
+    except sqlite3.Error:
+        log.exception("Failed to persist created event posted ids during reminder")
+
+async def delete_old_bot_posts(channel: discord.abc.Messageable):
+    """Alte Umfragen und Updates des Bots entfernen, bevor eine neue Umfrage gepostet wird."""
+    async for msg in channel.history(limit=10):
+        if msg.author == bot.user and msg.embeds:
+            embed = msg.embeds[0]
+            if "Worauf hast du diese Woche Lust?" in embed.title or "Quartalsumfrage" in embed.title or "Tages-Update" in embed.title or "Wöchentliches Update" in embed.title:
+                try:
+                    await msg.delete()
+                    log.info(f"Deleted old poll/summary message {msg.id}")
+                except Exception:
+                    log.exception(f"Failed to delete old poll/summary message {msg.id}")
+
+async def send_new_poll(channel: discord.abc.Messageable, poll_id: str, now: datetime, quarterly: bool,
+                        use_next_quarter: bool = False) -> str:
+    """Gemeinsamer Teil von Wochen- und Quartalsumfrage: Datensatz anlegen, Embed bauen, posten."""
+    await asyncio.to_thread(create_poll_record, poll_id, now)
+    embed = await poll_embed_async(poll_id, channel.guild if isinstance(channel, discord.TextChannel) else None,
+                                   quarterly=quarterly, use_next_quarter=use_next_quarter)
+    # Neue Umfrage hat noch keine Optionen – die View muss dafür nicht lesen
+    view = QuarterlyPollView(poll_id, []) if quarterly else PollView(poll_id, [])
     try:
         bot.add_view(view)
     except Exception:
         pass
-    await channel.send(embed=embed, view=view)
+    sent = await channel.send(embed=embed, view=view)
+    remember_poll_message(poll_id, sent)
     return poll_id
 
+async def post_poll_to_channel(channel: discord.abc.Messageable, delete_old: bool = True):
+    if delete_old:
+        await delete_old_bot_posts(channel)
+    # Poll-ID und created_at aus demselben Zeitpunkt
+    now = datetime.now(tz=_TZ)
+    return await send_new_poll(channel, now.strftime(_ID_TIME_FMT), now, quarterly=False)
+
 async def post_quarterly_poll_to_channel(channel: discord.abc.Messageable, delete_old: bool = True):
     if delete_old:
-        # Delete old poll messages before posting new one
-        async for msg in channel.history(limit=10):
-            if msg.author == bot.user and msg.embeds:
-                embed = msg.embeds[0]
-                if "Worauf hast du diese Woche Lust?" in embed.title or "Quartalsumfrage" in embed.title or "Tages-Update" in embed.title or "Wöchentliches Update" in embed.title:
-                    try:
-                        await msg.delete()
-                        log.info(f"Deleted old poll/summary message {msg.id}")
-                    except Exception:
-                        log.exception(f"Failed to delete old poll/summary message {msg.id}")
-
-    now = datetime.now(ZoneInfo(POST_TIMEZONE))
+        await delete_old_bot_posts(channel)
+    now = datetime.now(_TZ)
     is_pre_quarter_month = now.month in [3, 6, 9, 12]
-    poll_id = datetime.now(tz=ZoneInfo(POST_TIMEZONE)).strftime("%Y%m%dT%H%M%S") + "_quarterly"
-    create_poll_record(poll_id)
-    embed = generate_quarterly_poll_embed_from_db(poll_id, channel.guild if isinstance(channel, discord.TextChannel) else None, show_matches_flag=show_matches.get(poll_id, False), use_next_quarter=is_pre_quarter_month)
-    view = QuarterlyPollView(poll_id)
-    try:
-        bot.add_view(view)
-    except Exception:
-        pass
-    await channel.send(embed=embed, view=view)
-    return poll_id
+    return await send_new_poll(channel, now.strftime(_ID_TIME_FMT) + "_quarterly", now, quarterly=True,
+                               use_next_quarter=is_pre_quarter_month)
 
 @bot.command()
 async def startpoll(ctx):
@@ -1606,9 +2265,13 @@ async def weeklysummary(ctx):
         log.exception("weeklysummary failed")
         await ctx.send(f"Fehler beim Erstellen der wöchentlichen Zusammenfassung: {e}")
 
+LISTPOLLS_MAX = 200
+
 @bot.command()
 async def listpolls(ctx, limit: int = 50):
-    rows = safe_db_query("SELECT id, created_at FROM polls ORDER BY created_at DESC LIMIT ?", (limit,), fetch=True)
+    # Obergrenze, damit "!listpolls 999999" nicht die ganze Tabelle lädt; negative Werte hießen für SQLite "ohne Limit"
+    limit = max(1, min(limit, LISTPOLLS_MAX))
+    rows = await db_query_async(SQL_SELECT_POLLS, (limit,), fetch=True)
     if not rows:
         await ctx.send("Keine Polls in der DB gefunden.")
         return
@@ -1622,7 +2285,7 @@ async def listpolls(ctx, limit: int = 50):
 @bot.command()
 async def exportpoll(ctx, poll_id: str):
     """Exportiert eine Umfrage als JSON."""
-    options = get_options(poll_id)
+    options = await asyncio.to_thread(get_options, poll_id)
     if not options:
         await ctx.send("Umfrage nicht gefunden.")
         return
@@ -1640,10 +2303,12 @@ async def exportpoll(ctx, poll_id: str):
         opt_map[opt_id] = text
         data["options"].append({"id": opt_id, "text": text, "author_id": author})
 
-    for opt_id, user_id in get_votes_for_poll(poll_id):
+    votes = await asyncio.to_thread(get_votes_for_poll, poll_id)
+    for opt_id, user_id in votes:
         data["votes"].append({"option_text": opt_map.get(opt_id), "user_id": user_id})
 
-    for user_id, slot in get_availability_for_poll(poll_id):
+    availability = await asyncio.to_thread(get_availability_for_poll, poll_id)
+    for user_id, slot in availability:
         data["availability"].append({"user_id": user_id, "slot": slot})
 
     import json
@@ -1651,6 +2316,47 @@ async def exportpoll(ctx, poll_id: str):
     file = discord.File(io.BytesIO(json_str.encode()), filename=f"poll_{poll_id}.json")
     await ctx.send(f"Export von Umfrage `{poll_id}`:", file=file)
 
+def import_poll_data(new_poll_id: str, data: dict, imported: datetime):
+    """Legt die Umfrage an und übernimmt Optionen, Votes und Verfügbarkeiten aus einem Export.
+
+    Alles in einer Transaktion: ein Commit für den ganzen Import, und ein Fehler hinterlässt keine halbe Umfrage.
+    """
+    con = get_db_connection()
+    with _db_lock:
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            create_poll_record(new_poll_id, imported)
+
+            # Optionen importieren; die neue ID kommt aus lastrowid
+            option_text_to_id = {}  # Text → neue Option-ID (für Votes)
+            for opt in data.get("options", []):
+                text = opt.get("text", "").strip()
+                author_id = opt.get("author_id")
+                if text:
+                    option_text_to_id[text] = add_option(new_poll_id, text, author_id, created_at=imported)
+
+            # Votes importieren
+            votes = []
+            for vote in data.get("votes", []):
+                text = vote.get("option_text", "").strip()
+                user_id = vote.get("user_id")
+                if text in option_text_to_id and user_id:
+                    votes.append((new_poll_id, option_text_to_id[text], user_id))
+            con.executemany(SQL_INSERT_VOTE, votes)
+
+            # Verfügbarkeiten importieren; die Umfrage ist neu, es gibt nichts zu ersetzen
+            slots = []
+            for avail in data.get("availability", []):
+                user_id = avail.get("user_id")
+                slot = avail.get("slot")
+                if user_id and slot:
+                    slots.append((new_poll_id, user_id, slot))
+            con.executemany(SQL_INSERT_AVAILABILITY, slots)
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
+
 @bot.command()
 async def importpoll(ctx):
     """Importiert eine Umfrage aus einer JSON-Datei (z.B. von !exportpoll)."""
@@ -1674,47 +2380,29 @@ async def importpoll(ctx):
 
     # Neue Poll-ID erzeugen
     is_quarterly = "_quarterly" in data.get("poll_id", "")
-    new_poll_id = datetime.now(tz=ZoneInfo(POST_TIMEZONE)).strftime("%Y%m%dT%H%M%S") + ("_quarterly" if is_quarterly else "_import")
-
-    create_poll_record(new_poll_id)
-
-    # Optionen importieren
-    option_text_to_id = {}  # Text → neue Option-ID (für Votes)
-    for opt in data.get("options", []):
-        text = opt.get("text", "").strip()
-        author_id = opt.get("author_id")
-        if text:
-            new_id = add_option(new_poll_id, text, author_id)
-            option_text_to_id[text] = new_id
-
-    # Votes importieren
-    for vote in data.get("votes", []):
-        text = vote.get("option_text", "").strip()
-        user_id = vote.get("user_id")
-        if text in option_text_to_id and user_id:
-            add_vote(new_poll_id, option_text_to_id[text], user_id)
-
-    # Verfügbarkeiten importieren
-    user_slots = {}
-    for avail in data.get("availability", []):
-        user_id = avail.get("user_id")
-        slot = avail.get("slot")
-        if user_id and slot:
-            user_slots.setdefault(user_id, set()).add(slot)
-
-    for user_id, slots in user_slots.items():
-        persist_availability(new_poll_id, user_id, list(slots))
+    now = datetime.now(tz=_TZ)
+    new_poll_id = now.strftime(_ID_TIME_FMT) + ("_quarterly" if is_quarterly else "_import")
+
+    # Alle Inserts im Thread-Pool, damit große Importe den Event-Loop nicht blockieren
+    try:
+        await asyncio.to_thread(import_poll_data, new_poll_id, data, now)
+    except sqlite3.Error:
+        log.exception("importpoll failed")
+        await ctx.send("❌ Import fehlgeschlagen – es wurde nichts übernommen.")
+        return
 
     # Erfolgsmeldung + Umfrage posten
     try:
         if is_quarterly:
-            embed = generate_quarterly_poll_embed_from_db(new_poll_id, ctx.guild, show_matches_flag=False)
+            embed = await poll_embed_async(new_poll_id, ctx.guild, quarterly=True, show_matches_flag=False)
             view = QuarterlyPollView(new_poll_id)
             msg = await ctx.send("✅ **Quartalsumfrage erfolgreich importiert!**", embed=embed, view=view)
+            remember_poll_message(new_poll_id, msg)
         else:
-            embed = generate_poll_embed_from_db(new_poll_id, ctx.guild, show_matches_flag=False)
+            embed = await poll_embed_async(new_poll_id, ctx.guild, quarterly=False, show_matches_flag=False)
             view = PollView(new_poll_id)
             msg = await ctx.send("✅ **Wöchentliche Umfrage erfolgreich importiert!**", embed=embed, view=view)
+            remember_poll_message(new_poll_id, msg)
 
         await ctx.send(f"**Neue Poll-ID:** `{new_poll_id}`")
         log.info(f"Umfrage importiert: {new_poll_id} aus {attachment.filename}")
@@ -1732,127 +2420,154 @@ async def rerenderpoll(ctx, poll_id: str = None):
 
     try:
         if "_quarterly" in poll_id:
-            embed = generate_quarterly_poll_embed_from_db(poll_id, ctx.guild, show_matches_flag=show_matches.get(poll_id, False))
+            embed = await poll_embed_async(poll_id, ctx.guild, quarterly=True)
             view = QuarterlyPollView(poll_id)
         else:
-            embed = generate_poll_embed_from_db(poll_id, ctx.guild, show_matches_flag=show_matches.get(poll_id, False))
+            embed = await poll_embed_async(poll_id, ctx.guild, quarterly=False)
             view = PollView(poll_id)
 
         bot.add_view(view)
 
-        # Suche die alte Nachricht und editiere sie
-        found = False
-        async for msg in ctx.channel.history(limit=100):
-            if msg.author == bot.user and msg.embeds:
-                em = msg.embeds[0]
-                if poll_id in str(em.title) or "Quartalsumfrage" in em.title or "Worauf hast du" in em.title:
-                    await msg.edit(embed=embed, view=view)
-                    await ctx.send(f"✅ Poll `{poll_id}` wurde neu gerendert.")
-                    found = True
-                    break
-
-        if not found:
+        # Bekannte Nachricht direkt bearbeiten; nur wenn sie fehlt, den Kanalverlauf durchsuchen
+        known = _poll_messages.get(poll_id)
+        if known:
+            try:
+                await bot.get_partial_messageable(known[0]).get_partial_message(known[1]).edit(embed=embed, view=view)
+                await ctx.send(f"✅ Poll `{poll_id}` wurde neu gerendert.")
+                return
+            except discord.NotFound:
+                forget_poll_message(poll_id)
+
+        msg = await find_poll_message(ctx.channel, poll_id)
+        if msg is not None:
+            await msg.edit(embed=embed, view=view)
+            remember_poll_message(poll_id, msg)
+            await ctx.send(f"✅ Poll `{poll_id}` wurde neu gerendert.")
+        else:
             await ctx.send("Keine passende Nachricht gefunden. Poste sie manuell neu mit `!startquarterlypoll` oder `!startpoll`.")
     except Exception as e:
         await ctx.send(f"Fehler: {e}")
         log.exception("rerenderpoll failed")
 
+def voters_without_availability(poll_id: str) -> List[int]:
+    """Abstimmende, die noch keine Zeiten/Tage eingetragen haben."""
+    rows = safe_db_query(SQL_SELECT_VOTERS_WITHOUT_AVAILABILITY, (poll_id,), fetch=True)
+    return [r[0] for r in rows or []]
+
 def get_last_daily_summary(channel_id: int):
-    rows = safe_db_query("SELECT message_id FROM daily_summaries WHERE channel_id = ?", (channel_id,), fetch=True)
+    rows = safe_db_query(SQL_SELECT_DAILY_SUMMARY, (channel_id,), fetch=True)
     return rows[0][0] if rows and rows[0][0] is not None else None
 
 def set_last_daily_summary(channel_id: int, message_id: int):
-    now = datetime.now(timezone.utc).isoformat()
-    safe_db_query("INSERT OR REPLACE INTO daily_summaries(channel_id, message_id, created_at) VALUES (?, ?, ?)",
+    now = int(time.time())
+    safe_db_query(SQL_UPSERT_DAILY_SUMMARY,
                (channel_id, message_id, now))
 
 def get_last_weekly_summary(channel_id: int):
-    rows = safe_db_query("SELECT message_id FROM weekly_summaries WHERE channel_id = ?", (channel_id,), fetch=True)
+    rows = safe_db_query(SQL_SELECT_WEEKLY_SUMMARY, (channel_id,), fetch=True)
     return rows[0][0] if rows and rows[0][0] is not None else None
 
 def set_last_weekly_summary(channel_id: int, message_id: int):
-    now = datetime.now(timezone.utc).isoformat()
-    safe_db_query("INSERT OR REPLACE INTO weekly_summaries(channel_id, message_id, created_at) VALUES (?, ?, ?)",
+    now = int(time.time())
+    safe_db_query(SQL_UPSERT_WEEKLY_SUMMARY,
                (channel_id, message_id, now))
 
-async def post_daily_summary():
-    await bot.wait_until_ready()
-    channel = None
+def get_setting(key: str) -> Optional[str]:
+    rows = safe_db_query(SQL_SELECT_SETTING, (key,), fetch=True)
+    return rows[0][0] if rows else None
+
+def set_setting(key: str, value: str):
+    safe_db_query(SQL_UPSERT_SETTING, (key, value))
+
+# Ergebnis der Fallback-Suche über alle Textkanäle; liegt zusätzlich in settings, damit ein Neustart
+# nicht wieder alle Kanäle durchsucht. Vor jeder Verwendung werden die Schreibrechte des Kanals geprüft.
+FALLBACK_CHANNEL_SETTING = "post_channel_id"
+_fallback_channel_id: Optional[int] = None
+
+def load_fallback_channel():
+    global _fallback_channel_id
+    value = get_setting(FALLBACK_CHANNEL_SETTING)
+    _fallback_channel_id = int(value) if value else None
+
+async def default_post_channel() -> Optional[discord.abc.GuildChannel]:
+    """CHANNEL_ID oder ohne Konfiguration der erste Kanal, in den der Bot schreiben darf."""
+    global _fallback_channel_id
     if CHANNEL_ID:
         channel = bot.get_channel(CHANNEL_ID)
-    if not channel:
-        for g in bot.guilds:
-            for ch in g.text_channels:
-                try:
-                    perms = ch.permissions_for(g.me)
-                    if perms.send_messages:
-                        channel = ch
-                        break
-                except Exception:
-                    continue
-            if channel:
-                break
+        if channel:
+            return channel
+    if _fallback_channel_id is not None:
+        channel = bot.get_channel(_fallback_channel_id)
+        # Nur den gemerkten Kanal prüfen – die Rechte können sich geändert haben, während der Bot offline war
+        try:
+            if channel and channel.permissions_for(channel.guild.me).send_messages:
+                return channel
+        except Exception:
+            pass
+    for g in bot.guilds:
+        for ch in g.text_channels:
+            try:
+                if ch.permissions_for(g.me).send_messages:
+                    if ch.id != _fallback_channel_id:
+                        _fallback_channel_id = ch.id
+                        await db_write(set_setting, FALLBACK_CHANNEL_SETTING, str(ch.id))
+                    return ch
+            except Exception:
+                continue
+    return None
+
+def forget_fallback_channel():
+    # Nur im Speicher: der gespeicherte Wert wird beim nächsten Start ohnehin erst geprüft und dann ersetzt
+    global _fallback_channel_id
+    _fallback_channel_id = None
+
+async def post_daily_summary():
+    await bot.wait_until_ready()
+    channel = await default_post_channel()
     if not channel:
         log.info("Kein Kanal gefunden für Daily Summary.")
         return
     await post_daily_summary_to(channel)
 
 async def post_daily_summary_to(channel: discord.TextChannel):
-    rows = safe_db_query("SELECT id, created_at FROM polls WHERE id NOT LIKE '%_quarterly' ORDER BY created_at DESC LIMIT 1", fetch=True)
+    rows = await db_query_async(SQL_SELECT_LATEST_WEEKLY_POLL, fetch=True)
     if not rows:
         return
     poll_id, poll_created = rows[0]
-    tz = ZoneInfo(POST_TIMEZONE)
-    since = datetime.now(tz=tz) - timedelta(days=1)
-    new_options = get_options_since(poll_id, since)
-    current_matches = compute_matches_for_poll_from_db(poll_id)
-    last_matches = get_last_posted_matches(poll_id)
-    new_matches = {}
-    for key, infos in current_matches.items():
-        if key not in last_matches:
-            new_matches[key] = infos
-        else:
-            last_infos = last_matches[key]
-            for info in infos:
-                if info not in last_infos:
-                    if key not in new_matches:
-                        new_matches[key] = []
-                    new_matches[key].append(info)
+    now = datetime.now(tz=_TZ)
+    since = now - timedelta(days=1)
+    # Lesen und Match-Berechnung im Thread-Pool: der Job läuft auf dem Bot-Loop
+    new_options = await asyncio.to_thread(get_options_since, poll_id, since)
+    current_matches = await asyncio.to_thread(compute_matches_for_poll_from_db, poll_id)
+    last_matches = await asyncio.to_thread(get_last_posted_matches, poll_id)
+    new_matches = diff_matches(current_matches, last_matches)
     if (not new_options) and (not new_matches):
         return
-    embed = discord.Embed(title="🗓️ Tages-Update: Matches & neue Ideen", color=discord.Color.green(), timestamp=datetime.now(tz=tz))
+    embed = discord.Embed(title="🗓️ Tages-Update: Matches & neue Ideen", color=_COLOR_GREEN, timestamp=now)
     if new_options:
         lines = []
-        for opt_text, created_at in new_options:
-            try:
-                t = datetime.fromisoformat(created_at).astimezone(tz)
-                tstr = t.strftime("%d.%m. %H:%M")
-            except Exception:
-                tstr = created_at
+        for opt_text, created_epoch in new_options:
+            # der Zeitfilter schließt Zeilen ohne Epoch aus, hier ist sie immer gesetzt
+            tstr = datetime.fromtimestamp(created_epoch, _TZ).strftime(_SUMMARY_TIME_FMT)
             lines.append(f"- {opt_text} (hinzugefügt {tstr})")
         embed.add_field(name="🆕 Neue Ideen", value="\n".join(lines), inline=False)
     else:
         embed.add_field(name="🆕 Neue Ideen", value="Keine", inline=False)
+    guild = channel.guild if isinstance(channel, discord.TextChannel) else None
     if new_matches:
+        # Dieselben User tauchen in vielen Slots auf – Namen einmal auflösen
+        names = display_names(guild, (u for infos in new_matches.values() for info in infos for u in info["users"]))
         for opt_text, infos in new_matches.items():
             lines = []
             for info in infos:
-                slot = info["slot"]
-                day, hour_s = slot.split("-")
-                hour = int(hour_s)
-                timestr = slot_label_range(day, hour)
-                names = [user_display_name(channel.guild if isinstance(channel, discord.TextChannel) else None, u) for u in info["users"]]
-                lines.append(f"{timestr}: {', '.join(names)}")
+                timestr = format_slot_range(info["slot"])
+                lines.append(f"{timestr}: {', '.join(names[u] for u in info['users'])}")
             embed.add_field(name=f"🤝 Neue Matches — {opt_text}", value="\n".join(lines), inline=False)
     else:
         embed.add_field(name="🤝 Neue Matches", value="Keine neuen gemeinsamen Zeiten seit dem letzten Update.", inline=False)
-    voter_rows = safe_db_query("SELECT DISTINCT user_id FROM votes WHERE poll_id = ?", (poll_id,), fetch=True)
-    voters = [r[0] for r in voter_rows] if voter_rows else []
-    avail_rows = safe_db_query("SELECT DISTINCT user_id FROM availability WHERE poll_id = ?", (poll_id,), fetch=True)
-    has_avail = {r[0] for r in avail_rows} if avail_rows else set()
-    voters_no_avail = [uid for uid in voters if uid not in has_avail]
+    voters_no_avail = await asyncio.to_thread(voters_without_availability, poll_id)
     if voters_no_avail:
-        names = [user_display_name(channel.guild if isinstance(channel, discord.TextChannel) else None, uid) for uid in voters_no_avail]
+        names = [user_display_name(guild, uid) for uid in voters_no_avail]
         if len(names) > 30:
             shown = names[:30]
             remaining = len(names) - 30
@@ -1862,21 +2577,19 @@ async def post_daily_summary_to(channel: discord.TextChannel):
         embed.add_field(name="ℹ️ Abstimmende ohne eingetragene Zeiten", value=names_line, inline=False)
     else:
         embed.add_field(name="ℹ️ Abstimmende ohne eingetragene Zeiten", value="Alle Abstimmenden haben Zeiten eingetragen.", inline=False)
-    last_msg_id = get_last_daily_summary(channel.id)
+    last_msg_id = await asyncio.to_thread(get_last_daily_summary, channel.id)
     if last_msg_id:
         try:
-            prev = await channel.fetch_message(last_msg_id)
-            if prev:
-                await prev.delete()
+            await channel.get_partial_message(last_msg_id).delete()
         except discord.NotFound:
             pass
-        except Exception:
-            log.exception("Failed deleting previous daily summary")
+        except discord.HTTPException as e:
+            log.warning("Failed deleting previous daily summary: %s", e)
     sent = await channel.send(embed=embed)
     try:
-        set_last_daily_summary(channel.id, sent.id)
-        set_last_posted_matches(poll_id, current_matches)
-    except Exception:
+        await asyncio.to_thread(set_last_daily_summary, channel.id, sent.id)
+        await asyncio.to_thread(set_last_posted_matches, poll_id, current_matches)
+    except sqlite3.Error:
         log.exception("Failed saving daily summary id or last matches")
 
 async def post_weekly_summary():
@@ -1890,58 +2603,44 @@ async def post_weekly_summary():
     await post_weekly_summary_to(channel)
 
 async def post_weekly_summary_to(channel: discord.TextChannel):
-    rows = safe_db_query("SELECT id, created_at FROM polls WHERE id LIKE '%_quarterly' ORDER BY created_at DESC LIMIT 1", fetch=True)
+    rows = await db_query_async(SQL_SELECT_LATEST_QUARTERLY_POLL, fetch=True)
     if not rows:
         return
     poll_id, poll_created = rows[0]
-    tz = ZoneInfo(POST_TIMEZONE)
-    since = datetime.now(tz=tz) - timedelta(weeks=1)
-    new_options = get_options_since(poll_id, since)
-    current_matches = compute_matches_for_poll_from_db(poll_id)
-    last_matches = get_last_posted_weekly_matches(poll_id)
-    new_matches = {}
-    for key, infos in current_matches.items():
-        if key not in last_matches:
-            new_matches[key] = infos
-        else:
-            last_infos = last_matches[key]
-            for info in infos:
-                if info not in last_infos:
-                    if key not in new_matches:
-                        new_matches[key] = []
-                    new_matches[key].append(info)
+    now = datetime.now(tz=_TZ)
+    since = now - timedelta(weeks=1)
+    # Lesen und Match-Berechnung im Thread-Pool: der Job läuft auf dem Bot-Loop
+    new_options = await asyncio.to_thread(get_options_since, poll_id, since)
+    current_matches = await asyncio.to_thread(compute_matches_for_poll_from_db, poll_id)
+    last_matches = await asyncio.to_thread(get_last_posted_weekly_matches, poll_id)
+    new_matches = diff_matches(current_matches, last_matches)
     if (not new_options) and (not new_matches):
         return
-    embed = discord.Embed(title="🗓️ Wöchentliches Update: Matches & neue Ideen", color=discord.Color.blue(), timestamp=datetime.now(tz=tz))
+    embed = discord.Embed(title="🗓️ Wöchentliches Update: Matches & neue Ideen", color=_COLOR_BLUE, timestamp=now)
     if new_options:
         lines = []
-        for opt_text, created_at in new_options:
-            try:
-                t = datetime.fromisoformat(created_at).astimezone(tz)
-                tstr = t.strftime("%d.%m. %H:%M")
-            except Exception:
-                tstr = created_at
+        for opt_text, created_epoch in new_options:
+            # der Zeitfilter schließt Zeilen ohne Epoch aus, hier ist sie immer gesetzt
+            tstr = datetime.fromtimestamp(created_epoch, _TZ).strftime(_SUMMARY_TIME_FMT)
             lines.append(f"- {opt_text} (hinzugefügt {tstr})")
         embed.add_field(name="🆕 Neue Ideen", value="\n".join(lines), inline=False)
     else:
         embed.add_field(name="🆕 Neue Ideen", value="Keine", inline=False)
+    guild = channel.guild if isinstance(channel, discord.TextChannel) else None
     if new_matches:
+        # Dieselben User tauchen in vielen Slots auf – Namen einmal auflösen
+        names = display_names(guild, (u for infos in new_matches.values() for info in infos for u in info["users"]))
         for opt_text, infos in new_matches.items():
             lines = []
             for info in infos:
                 slot = info["slot"]
-                names = [user_display_name(channel.guild if isinstance(channel, discord.TextChannel) else None, u) for u in info["users"]]
-                lines.append(f"{slot}: {', '.join(names)}")
+                lines.append(f"{slot}: {', '.join(names[u] for u in info['users'])}")
             embed.add_field(name=f"🤝 Neue Matches — {opt_text}", value="\n".join(lines), inline=False)
     else:
         embed.add_field(name="🤝 Neue Matches", value="Keine neuen gemeinsamen Tage seit dem letzten Update.", inline=False)
-    voter_rows = safe_db_query("SELECT DISTINCT user_id FROM votes WHERE poll_id = ?", (poll_id,), fetch=True)
-    voters = [r[0] for r in voter_rows] if voter_rows else []
-    avail_rows = safe_db_query("SELECT DISTINCT user_id FROM availability WHERE poll_id = ?", (poll_id,), fetch=True)
-    has_avail = {r[0] for r in avail_rows} if avail_rows else set()
-    voters_no_avail = [uid for uid in voters if uid not in has_avail]
+    voters_no_avail = await asyncio.to_thread(voters_without_availability, poll_id)
     if voters_no_avail:
-        names = [user_display_name(channel.guild if isinstance(channel, discord.TextChannel) else None, uid) for uid in voters_no_avail]
+        names = [user_display_name(guild, uid) for uid in voters_no_avail]
         if len(names) > 30:
             shown = names[:30]
             remaining = len(names) - 30
@@ -1951,55 +2650,51 @@ async def post_weekly_summary_to(channel: discord.TextChannel):
         embed.add_field(name="ℹ️ Abstimmende ohne eingetragene Tage", value=names_line, inline=False)
     else:
         embed.add_field(name="ℹ️ Abstimmende ohne eingetragene Tage", value="Alle Abstimmenden haben Tage eingetragen.", inline=False)
-    last_msg_id = get_last_weekly_summary(channel.id)
+    last_msg_id = await asyncio.to_thread(get_last_weekly_summary, channel.id)
     if last_msg_id:
         try:
-            prev = await channel.fetch_message(last_msg_id)
-            if prev:
-                await prev.delete()
+            await channel.get_partial_message(last_msg_id).delete()
         except discord.NotFound:
             pass
-        except Exception:
-            log.exception("Failed deleting previous weekly summary")
+        except discord.HTTPException as e:
+            log.warning("Failed deleting previous weekly summary: %s", e)
     sent = await channel.send(embed=embed)
     try:
-        set_last_weekly_summary(channel.id, sent.id)
-        set_last_posted_weekly_matches(poll_id, current_matches)
-    except Exception:
+        await asyncio.to_thread(set_last_weekly_summary, channel.id, sent.id)
+        await asyncio.to_thread(set_last_posted_weekly_matches, poll_id, current_matches)
+    except sqlite3.Error:
         log.exception("Failed saving weekly summary id or last matches")
 
-def job_post_weekly():
-    asyncio.create_task(job_post_weekly_coro())
+def _log_task_exception(task: asyncio.Task):
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        log.error("%s failed", task.get_name(), exc_info=exc)
+
+# Starke Referenzen auf laufende Hintergrund-Tasks; asyncio hält selbst nur schwache,
+# sodass ein nicht referenzierter Task mitten im Lauf eingesammelt werden kann
+_pending_tasks: Set[asyncio.Task] = set()
+
+def spawn_background(coro, name: Optional[str] = None) -> asyncio.Task:
+    task = asyncio.create_task(coro, name=name)
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+    task.add_done_callback(_log_task_exception)
+    return task
 
 async def job_post_weekly_coro():
     await bot.wait_until_ready()
-    channel = None
-    if CHANNEL_ID:
-        channel = bot.get_channel(CHANNEL_ID)
-    if not channel:
-        for g in bot.guilds:
-            for ch in g.text_channels:
-                try:
-                    perms = ch.permissions_for(g.me)
-                    if perms.send_messages:
-                        channel = ch
-                        break
-                except Exception:
-                    continue
-            if channel:
-                break
+    channel = await default_post_channel()
     if not channel:
         log.info("Kein Kanal gefunden: bitte CHANNEL_ID setzen oder verwende !startpoll in einem Kanal.")
         return
     try:
         poll_id = await post_poll_to_channel(channel)
-        log.info(f"Posted weekly poll {poll_id} to {channel} at {datetime.now(tz=ZoneInfo(POST_TIMEZONE))}")
+        log.info(f"Posted weekly poll {poll_id} to {channel} at {datetime.now(tz=_TZ)}")
     except Exception:
         log.exception("Failed posting weekly poll job")
 
-def job_post_quarterly():
-    asyncio.create_task(job_post_quarterly_coro())
-
 async def job_post_quarterly_coro():
     await bot.wait_until_ready()
     channel = None
@@ -2010,76 +2705,117 @@ async def job_post_quarterly_coro():
         return
     try:
         poll_id = await post_quarterly_poll_to_channel(channel)
-        log.info(f"Posted quarterly poll {poll_id} to {channel} at {datetime.now(tz=ZoneInfo(POST_TIMEZONE))}")
+        log.info(f"Posted quarterly poll {poll_id} to {channel} at {datetime.now(tz=_TZ)}")
     except Exception:
         log.exception("Failed posting quarterly poll job")
 
 def schedule_weekly_post():
-    trigger = CronTrigger(day_of_week="sun", hour=12, minute=0, timezone=ZoneInfo(POST_TIMEZONE))
+    trigger = CronTrigger(day_of_week="sun", hour=12, minute=0, timezone=_TZ)
     scheduler.add_job(job_post_weekly_coro, trigger=trigger, id="weekly_poll", replace_existing=True)
 
 def schedule_quarterly_post():
-    now = datetime.now(ZoneInfo(POST_TIMEZONE))
-    if now.month <= 3:
-        post_month = 3  # März für Q2
-        post_year = now.year
-    elif now.month <= 6:
-        post_month = 6  # Juni für Q3
-        post_year = now.year
-    elif now.month <= 9:
-        post_month = 9  # September für Q4
-        post_year = now.year
-    else:
-        post_month = 12  # Dezember für Q1 nächsten Jahres
-        post_year = now.year
-    trigger = CronTrigger(day=1, month=post_month, year=post_year, hour=12, minute=0, timezone=ZoneInfo(POST_TIMEZONE))
+    # März für Q2, Juni für Q3, September für Q4, Dezember für Q1 des nächsten Jahres.
+    # Ohne festes Jahr feuert der Job jedes Quartal, auch wenn er nur einmal beim Start angelegt wird.
+    trigger = CronTrigger(day=1, month="3,6,9,12", hour=12, minute=0, timezone=_TZ)
     scheduler.add_job(job_post_quarterly_coro, trigger=trigger, id="quarterly_poll", replace_existing=True)
 
 def schedule_weekly_summary():
-    trigger = CronTrigger(day_of_week="mon", hour=9, minute=0, timezone=ZoneInfo(POST_TIMEZONE))
+    trigger = CronTrigger(day_of_week="mon", hour=9, minute=0, timezone=_TZ)
     scheduler.add_job(post_weekly_summary, trigger=trigger, id="weekly_summary", replace_existing=True)
 
 def schedule_daily_summary():
-    trigger_morning = CronTrigger(day_of_week="*", hour=9, minute=0, timezone=ZoneInfo(POST_TIMEZONE))
+    trigger_morning = CronTrigger(day_of_week="*", hour=9, minute=0, timezone=_TZ)
     scheduler.add_job(post_daily_summary, trigger=trigger_morning, id="daily_summary_morning", replace_existing=True)
-    trigger_evening = CronTrigger(day_of_week="*", hour=18, minute=0, timezone=ZoneInfo(POST_TIMEZONE))
+    trigger_evening = CronTrigger(day_of_week="*", hour=18, minute=0, timezone=_TZ)
     scheduler.add_job(post_daily_summary, trigger=trigger_evening, id="daily_summary_evening", replace_existing=True)
 
-async def register_persistent_poll_views_async(batch_delay: float = 0.02):
-    rows = safe_db_query("SELECT id FROM polls ORDER BY created_at DESC LIMIT 20", fetch=True) or []
-    if not rows:
+async def register_persistent_views_async(batch_delay: float = 0.02):
+    event_rows, poll_rows, option_rows, message_rows = await asyncio.to_thread(read_startup_rows)
+    for poll_id, channel_id, message_id in message_rows:
+        _poll_messages.setdefault(poll_id, (channel_id, message_id))
+    # Optionen vorab gruppieren, damit die Views beim Aufbau nicht einzeln auf dem Event-Loop lesen
+    options_by_poll: Dict[str, list] = {}
+    for poll_id, *option in option_rows:
+        options_by_poll.setdefault(poll_id, []).append(tuple(option))
+    fill_created_events_cache(event_rows)
+    event_ids = [eid for eid, row in _created_events.items() if row[_EV_POSTED_MESSAGE] is not None]
+    if not event_ids and not poll_rows:
         return
     await asyncio.sleep(0.5)
-    for (poll_id,) in rows:
+    for event_id in event_ids:
+        try:
+            bot.add_view(EventSignupView(event_id))
+        except Exception:
+            log.exception("Failed to restore persistent view for created event %s", event_id)
+    for (poll_id,) in poll_rows:
         try:
+            options = options_by_poll.get(poll_id, [])
             if "_quarterly" in poll_id:
-                view = QuarterlyPollView(poll_id)
+                view = QuarterlyPollView(poll_id, options)
             else:
-                view = PollView(poll_id)
+                view = PollView(poll_id, options)
             bot.add_view(view)
         except Exception:
             log.exception("Failed to add persistent view for poll %s", poll_id)
         await asyncio.sleep(batch_delay)
 
-@bot.event
-async def on_ready():
-    log.info(f"✅ Eingeloggt als {bot.user} (ID: {bot.user.id})")
+async def setup_hook():
+    """Einmalige Initialisierung vor dem Gateway-Login; on_ready feuert bei jedem Reconnect erneut."""
+    global _reminder_task
     init_db()
-    if not scheduler.running:
-        scheduler.start()
+    # Jobs vor dem Start anlegen: der Scheduler übernimmt sie gesammelt, statt nach jedem add_job aufzuwachen
     schedule_weekly_post()
     schedule_quarterly_post()
     schedule_weekly_summary()
     schedule_daily_summary()
-    try:
-        bot.loop.create_task(register_persistent_poll_views_async(batch_delay=0.02))
-        log.info("Scheduled async registration of PollView instances for existing polls.")
-    except Exception:
-        log.exception("Failed to schedule persistent view registration on startup.")
+    if not scheduler.running:
+        scheduler.start()
+    spawn_background(db_writer_loop(), name="DB writer")
+    if _reminder_task is None or _reminder_task.done():
+        _reminder_task = spawn_background(created_event_reminder_loop(), name="Created-event reminder loop")
+    spawn_background(register_persistent_views_async(batch_delay=0.02), name="Persistent view registration")
+    log.info("Scheduled async registration of persistent views for existing polls and created events.")
+
+bot.setup_hook = setup_hook
+
+@bot.event
+async def on_ready():
+    log.info(f"✅ Eingeloggt als {bot.user} (ID: {bot.user.id})")
+    # Gemerkten Fallback-Kanal laden; default_post_channel prüft dessen Rechte vor der Verwendung,
+    # eine nach dem Reconnect geänderte Kanalliste fällt so auf, ohne alle Kanäle zu durchsuchen
+    await asyncio.to_thread(load_fallback_channel)
+    forget_display_names()
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    if channel.id == _fallback_channel_id:
+        forget_fallback_channel()
+
+@bot.event
+async def on_member_update(before, after):
+    if before.display_name != after.display_name:
+        forget_display_names()
+
+@bot.event
+async def on_user_update(before, after):
+    if before.name != after.name or before.display_name != after.display_name:
+        forget_display_names()
+
+@bot.event
+async def on_member_join(member):
+    # Bisher ggf. nur als ID oder globaler Name gemerkt
+    forget_display_names()
+
+@bot.event
+async def on_member_remove(member):
+    forget_display_names()
 
 if __name__ == "__main__":
     if not BOT_TOKEN:
         print("Bitte BOT_TOKEN als Umgebungsvariable setzen.")
         raise SystemExit(1)
-    init_db()
-    bot.run(BOT_TOKEN)
+    # init_db läuft in setup_hook; die Verbindung bleibt bis zum Ende des Prozesses offen
+    try:
+        bot.run(BOT_TOKEN)
+    finally:
+        close_db()